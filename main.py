@@ -7,20 +7,20 @@ It includes functionality for data collection, API testing, dataset viewing, and
 
 from dotenv import load_dotenv
 import os
-import spotipy
-from spotipy.oauth2 import SpotifyClientCredentials
 import pandas as pd
 import json
 from datetime import datetime
 import sys
+import time
+import gc
+import functools
+from concurrent.futures import Future, ThreadPoolExecutor
 import numpy as np
 import logging
+import logging.handlers
+from collections import deque
 from pathlib import Path
-import requests
-import great_expectations as ge
-from great_expectations.core import ExpectationSuite
-from great_expectations.dataset import PandasDataset
-from typing import Dict, List, Optional, Union
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
 # Load environment variables
 load_dotenv()
@@ -28,9 +28,10 @@ load_dotenv()
 # Add src directory to path for proper imports
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
+# Spotify client (spotipy) and Great Expectations are imported where they are used,
+# so menu options that only read local data start without paying for them
 try:
-    from src.data_collection.optimised_title_collector import OptimisedTitleCollector
-    from src.data_processing.data_loader import SpotifyDataLoader
+    from src.data_processing.data_loader import SpotifyDataLoader, save_csv, save_parquet, CATEGORY_COLUMNS
     from src.data_processing.post_eda_cleaner import PostEDADataCleaner
     # Note: BusinessInsightGenerator will be created when needed
 except ImportError as e:
@@ -42,46 +43,179 @@ logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler('spotify_analysis.log'),
+        # Rotate instead of growing forever; the file is only opened on first write
+        logging.handlers.RotatingFileHandler(
+            'spotify_analysis.log', maxBytes=5 * 1024 * 1024, backupCount=3, delay=True
+        ),
         logging.StreamHandler(sys.stdout)
     ]
 )
 
+# Number of trailing log lines shown in step 8, and how far back to seek for them
+LOG_TAIL_LINES = 500
+LOG_TAIL_BYTES = 256 * 1024
+
+# Track IDs fetched in the step 1 batched-endpoint smoke test (Spotify allows up to 50)
+BATCH_TEST_SIZE = 20
+
+# Columns each step actually reads - everything else stays on disk
+SUMMARY_COLUMNS = ['genre_category', 'popularity', 'title_length', 'release_year']
+EDA_COLUMNS = [
+    'popularity', 'title_length', 'word_count', 'genre_category',
+    'has_numbers', 'release_year', 'artist_name'
+]
+
+def scan_files(directory: Union[str, Path], prefix: str, suffixes: tuple) -> List[os.DirEntry]:
+    """
+    List files by name prefix/suffix with a single directory scan.
+    
+    Returns DirEntry objects, which work anywhere a path does and cache their stat() result.
+    """
+    if not os.path.isdir(directory):
+        return []
+    with os.scandir(directory) as entries:
+        return sorted(
+            (entry for entry in entries
+             if entry.name.startswith(prefix) and entry.name.endswith(suffixes) and entry.is_file()),
+            key=lambda entry: entry.name
+        )
+
+def find_datasets(data_dir: Path, prefix: str = "spotify") -> List[os.DirEntry]:
+    """List Spotify datasets, preferring the Parquet copy over a CSV with the same name."""
+    entries = scan_files(data_dir, prefix, (".csv", ".parquet"))
+    parquet_stems = {os.path.splitext(entry.name)[0] for entry in entries if entry.name.endswith(".parquet")}
+    return [
+        entry for entry in entries
+        if entry.name.endswith(".parquet") or os.path.splitext(entry.name)[0] not in parquet_stems
+    ]
+
+def load_dataset(path: Union[str, Path], columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Load a dataset from Parquet, or from CSV with PyArrow's multithreaded reader.
+    
+    Args:
+        path: Path to the CSV or Parquet file
+        columns: Optional column whitelist; columns missing from the file are skipped
+        
+    Returns:
+        DataFrame containing only the requested columns, with genre/artist as categoricals
+    """
+    path = Path(path)
+    is_parquet = path.suffix == ".parquet"
+    if columns is not None:
+        if is_parquet:
+            import pyarrow.parquet as pq
+            header = pq.read_schema(path).names
+        else:
+            header = pd.read_csv(path, nrows=0).columns
+        columns = [col for col in columns if col in header]
+    if is_parquet:
+        # Categorical and bool columns round-trip natively from Parquet
+        return pd.read_parquet(path, columns=columns)
+    df = pd.read_csv(path, engine="pyarrow", usecols=columns, dtype_backend="pyarrow")
+    # Group and count on integer codes rather than re-hashing strings in every step
+    return df.astype({col: "category" for col in CATEGORY_COLUMNS if col in df.columns})
+
+def preview_dataset(path: Union[str, Path], rows: int = 5) -> pd.DataFrame:
+    """Read only the first few rows of a dataset."""
+    path = Path(path)
+    if path.suffix == ".parquet":
+        import pyarrow.parquet as pq
+        batch = next(pq.ParquetFile(path).iter_batches(batch_size=rows), None)
+        return batch.to_pandas() if batch is not None else pd.DataFrame()
+    return pd.read_csv(path, nrows=rows)
+
+# Background reader used to parse a dataset while the user is still choosing one
+_io_pool = ThreadPoolExecutor(max_workers=2)
+
+def prefetch_dataset(datasets: List[os.DirEntry], columns: Optional[List[str]] = None) -> Tuple[os.DirEntry, Future]:
+    """Start loading the most recently modified dataset, the usual choice, in the background."""
+    latest = max(datasets, key=lambda entry: entry.stat().st_mtime)
+    return latest, _io_pool.submit(load_dataset, latest, columns)
+
+def take_dataset(selected: os.DirEntry, prefetched: Tuple[os.DirEntry, Future],
+                 columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """Return the prefetched frame if the user picked that dataset, otherwise load the selection."""
+    latest, future = prefetched
+    if os.fspath(selected) == os.fspath(latest):
+        return future.result()
+    future.cancel()
+    return load_dataset(selected, columns)
+
 class SpotifyDataValidator:
     """Validates Spotify data quality using Great Expectations."""
     
+    # Great Expectations context and suite, shared by every instance once initialised
+    _context = None
+    _suite = None
+    
     def __init__(self, data_dir: str = "data"):
         self.data_dir = Path(data_dir)
-        try:
-            self.context = ge.get_context()
-            self._setup_expectation_suite()
-        except Exception as e:
-            logging.warning(f"Great Expectations initialization failed: {e}")
-            self.context = None
-            self.suite = None
+        self.context, self.suite = type(self).get_context_and_suite()
+    
+    @classmethod
+    def get_context_and_suite(cls):
+        """Initialise Great Expectations on first use and reuse the context and suite afterwards."""
+        if cls._context is None:
+            try:
+                import great_expectations as ge
+                context = ge.get_context()
+            except Exception as e:
+                logging.warning(f"Great Expectations initialization failed: {e}")
+                return None, None
+            cls._context = context
+            cls._suite = cls._setup_expectation_suite(context)
+        return cls._context, cls._suite
     
-    def _setup_expectation_suite(self):
+    @staticmethod
+    def _setup_expectation_suite(context):
         """Set up the expectation suite for Spotify data validation."""
-        if self.context is None:
-            self.suite = None
-            return
-        
         try:
-            self.suite = self.context.get_expectation_suite("spotify_data_suite")
+            return context.get_expectation_suite("spotify_data_suite")
         except Exception:
             try:
-                self.suite = self.context.create_expectation_suite("spotify_data_suite")
+                return context.create_expectation_suite("spotify_data_suite")
             except Exception:
                 logging.warning("Could not create expectation suite, continuing without validation")
-                self.suite = None
+                return None
+    
+    # (column, min, max) bounds mirrored from the expectations below
+    RANGE_CHECKS = [
+        ("popularity", 20, 100),
+        ("duration_ms", 0, None),
+        ("title_length", 1, 200),
+        ("word_count", 1, 50),
+    ]
+    NOT_NULL_COLUMNS = ["track_name", "artist_name", "genre"]
+    UNIQUE_KEY = ["track_name", "artist_name"]
     
-    def validate_dataset(self, df: pd.DataFrame) -> Dict:
-        """Validate a dataset against our expectations."""
+    def validate_dataset(self, df: pd.DataFrame, detailed: bool = False) -> Dict:
+        """
+        Validate a dataset against our expectations.
+        
+        Args:
+            df: Dataset to validate
+            detailed: If True, use Great Expectations to report on any checks that
+                fail the vectorised pass
+        """
+        checks = self._run_vectorised_checks(df)
+        passed = all(checks.values())
+        
+        # Clean datasets never need the expensive row-wise Great Expectations run
+        if passed or not detailed:
+            return {
+                "success": passed,
+                "results": [name for name, ok in checks.items() if not ok],
+                "checks": checks,
+                "fast_path": True
+            }
+        
         if self.suite is None:
             logging.warning("Great Expectations not properly initialized, skipping validation")
             return {"success": True, "results": []}
         
         try:
+            from great_expectations.dataset import PandasDataset
             ge_df = PandasDataset(df)
             
             # Define expectations for title analysis
@@ -102,6 +236,46 @@ class SpotifyDataValidator:
         except Exception as e:
             logging.error(f"Validation failed: {e}")
             return {"success": False, "error": str(e)}
+    
+    def _run_vectorised_checks(self, df: pd.DataFrame) -> Dict[str, bool]:
+        """Evaluate each expectation as a single NumPy reduction over its column."""
+        checks = {}
+        
+        for col in self.NOT_NULL_COLUMNS:
+            checks[f"{col}_not_null"] = col in df.columns and not df[col].isna().any()
+        
+        for col, min_val, max_val in self.RANGE_CHECKS:
+            if col not in df.columns:
+                checks[f"{col}_in_range"] = False
+                continue
+            values = df[col].to_numpy(dtype="float64", na_value=np.nan)
+            in_range = values >= min_val
+            if max_val is not None:
+                in_range &= values <= max_val
+            # Nulls are ignored, as Great Expectations does for range checks
+            checks[f"{col}_in_range"] = bool((in_range | np.isnan(values)).all())
+        
+        if all(col in df.columns for col in self.UNIQUE_KEY):
+            checks["track_artist_unique"] = not df.duplicated(subset=self.UNIQUE_KEY).any()
+        else:
+            checks["track_artist_unique"] = False
+        
+        return checks
+
+def format_counts(counts: pd.Series) -> str:
+    """Format a value_counts() result as one indented block, ready for a single print."""
+    return "\n".join(f"   {value}: {count:,} tracks" for value, count in counts.items())
+
+def release_frames(step: Callable) -> Callable:
+    """Run a menu step, then collect its DataFrames so they don't linger between menu cycles."""
+    @functools.wraps(step)
+    def wrapper(*args, **kwargs):
+        try:
+            return step(*args, **kwargs)
+        finally:
+            # Locals are gone once the step returns; this also reclaims reference cycles
+            gc.collect()
+    return wrapper
 
 def clear_screen():
     """Clear the terminal screen."""
@@ -132,6 +306,46 @@ def show_menu():
     print("0. 🚪 Exit")
     return input("\nSelect an option: ")
 
+# Collectors are reused across menu iterations so Spotify auth happens once per process
+_COLLECTOR_CACHE = {}
+
+def get_collector(test_mode: bool, use_async: bool = False):
+    """Return the shared collector for this mode, creating it on first use."""
+    key = (bool(test_mode), bool(use_async))
+    collector = _COLLECTOR_CACHE.get(key)
+    if collector is None:
+        if use_async:
+            # Imported lazily so httpx is only required when --async is passed
+            from src.data_collection.async_title_collector import AsyncTitleCollector
+            collector = AsyncTitleCollector(test_mode=test_mode)
+        else:
+            from src.data_collection.optimised_title_collector import OptimisedTitleCollector
+            collector = OptimisedTitleCollector(test_mode=test_mode)
+        _COLLECTOR_CACHE[key] = collector
+    return collector
+
+def close_collectors():
+    """Stop the token refresh timers and HTTP sessions of every cached collector."""
+    while _COLLECTOR_CACHE:
+        _, collector = _COLLECTOR_CACHE.popitem()
+        collector.close()
+
+def check_batch_endpoint(collector, track_ids: List[str]):
+    """Fetch several tracks in one request to confirm the batched endpoint works."""
+    print("📦 Testing batched track lookup...")
+    start = time.perf_counter()
+    batch = collector.sp.tracks(track_ids)
+    batch_ms = (time.perf_counter() - start) * 1000
+    
+    # Time a single lookup to estimate what one request per track would cost
+    start = time.perf_counter()
+    collector.sp.track(track_ids[0])
+    single_ms = (time.perf_counter() - start) * 1000
+    
+    fetched = sum(1 for t in batch.get('tracks', []) if t)
+    print(f"✅ Batched {fetched} tracks in 1 request ({batch_ms:.0f} ms)")
+    print(f"   Sequential estimate: {len(track_ids)} requests (~{single_ms * len(track_ids):.0f} ms)")
+
 def run_step_1():
     """Test API connection."""
     clear_screen()
@@ -140,12 +354,12 @@ def run_step_1():
     print("-" * 40)
     
     try:
-        collector = OptimisedTitleCollector(test_mode=True)
+        collector = get_collector(test_mode=True)
         print("✅ API client initialization successful!")
         
         # Test actual search functionality
         print("🔍 Testing search functionality...")
-        test_results = collector.sp.search(q="year:2024 genre:pop", type='track', limit=1, offset=0)
+        test_results = collector.sp.search(q="year:2024 genre:pop", type='track', limit=BATCH_TEST_SIZE, offset=0)
         
         if test_results and 'tracks' in test_results:
             tracks = test_results['tracks']['items']
@@ -153,6 +367,7 @@ def run_step_1():
             if tracks:
                 track = tracks[0]
                 print(f"   Sample track: '{track['name']}' by {track['artists'][0]['name']}")
+                check_batch_endpoint(collector, [t['id'] for t in tracks])
         else:
             print("⚠️  Search API returned empty results")
             
@@ -161,6 +376,7 @@ def run_step_1():
         print(f"❌ API connection failed: {str(e)}")
         return False
 
+@release_frames
 def run_step_2():
     """Collect data using the new collector with test, medium, full, and mega options."""
     clear_screen()
@@ -177,11 +393,15 @@ def run_step_2():
     
     mode = input("\nSelect mode (1-5): ")
     
+    # One timestamp per run, shared by the recovery and collection output files
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    
     if mode == "5":
         # Recovery mode
         print("\n🔄 Recover Partial Collection...")
         data_dir = Path("data")
-        temp_dirs = list(data_dir.glob("temp_collection_*"))
+        # Track streams left behind by failed runs, plus older temp_collection_* directories
+        temp_dirs = sorted(data_dir.glob("tracks_*.parquet")) + list(data_dir.glob("temp_collection_*"))
         
         if not temp_dirs:
             print("❌ No partial collections found")
@@ -196,22 +416,28 @@ def run_step_2():
             choice = int(input("\nSelect a partial collection to recover (number): ")) - 1
             selected_dir = temp_dirs[choice]
             
-            collector = OptimisedTitleCollector(test_mode=False)
-            df = collector.recover_partial_collection(str(selected_dir))
+            collector = get_collector(test_mode=False)
+            if selected_dir.is_file():
+                df = collector.load_stream(selected_dir)
+            else:
+                df = collector.recover_partial_collection(str(selected_dir))
             
             if df is not None:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 filename = f"spotify_recovered_{timestamp}.csv"
-                df.to_csv(f"data/{filename}", index=False)
+                save_csv(df, f"data/{filename}")
+                parquet_path = save_parquet(df, f"data/{filename}")
                 print(f"\n✅ Recovery complete!")
-                print(f"💾 Data saved to: data/{filename}")
+                print(f"💾 Data saved to: data/{filename} (+ {parquet_path.name})")
                 
                 # Ask if user wants to clean up the temp directory
                 cleanup = input("\n🧹 Delete temporary files? (y/N): ")
                 if cleanup.lower() == 'y':
-                    for file in selected_dir.glob("*.csv"):
-                        file.unlink()
-                    selected_dir.rmdir()
+                    if selected_dir.is_file():
+                        selected_dir.unlink()
+                    else:
+                        for file in selected_dir.glob("*.csv"):
+                            file.unlink()
+                        selected_dir.rmdir()
                     print("✅ Temporary files cleaned up")
             else:
                 print("\n❌ Recovery failed")
@@ -252,50 +478,62 @@ def run_step_2():
     else:
         print(f"\n{start_message}")
     
-    # Run the collection
-    collector = OptimisedTitleCollector(test_mode=False)
+    # Run the collection (--async switches to the asyncio/httpx collector)
+    collector = get_collector(test_mode=False, use_async="--async" in sys.argv[1:])
     collector.set_collection_size(size)
     df = collector.collect_tracks()
     
     if df is not None:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"spotify_{size}_{timestamp}.csv"
-        df.to_csv(f"data/{filename}", index=False)
+        save_csv(df, f"data/{filename}")
+        parquet_path = save_parquet(df, f"data/{filename}")
+        # The dataset is saved, so the raw track stream is no longer needed for recovery
+        collector.stream_path.unlink(missing_ok=True)
+        # One counting pass per column; nunique/max/mean are derived from the counts.
+        # Genre and year share a single grouped count and are read off its marginals.
+        year_counts = None
+        if 'release_year' in df.columns:
+            genre_year = df.groupby(['genre_category', 'release_year'], observed=True).size().unstack(fill_value=0)
+            genre_counts = genre_year.sum(axis=1).sort_values(ascending=False)
+            year_counts = genre_year.sum(axis=0).sort_index()
+        else:
+            genre_counts = df['genre_category'].value_counts()
+        artist_counts = df['artist_name'].value_counts() if 'artist_name' in df.columns else None
+        
         print(f"\n✅ {mode_name} complete!")
         print(f"📊 Total tracks collected: {len(df):,}")
-        print(f"🎵 Genres: {df['genre_category'].nunique()}")
-        if 'artist_name' in df.columns:
-            print(f"👥 Unique artists: {df['artist_name'].nunique():,}")
-        print(f"💾 Data saved to: data/{filename}")
+        print(f"🎵 Genres: {genre_counts.size}")
+        if artist_counts is not None:
+            print(f"👥 Unique artists: {artist_counts.size:,}")
+        print(f"💾 Data saved to: data/{filename} (+ {parquet_path.name})")
         
         # Show temporal distribution for larger collections
-        if mode in ["3", "4"] and 'release_year' in df.columns:
+        if mode in ["3", "4"] and year_counts is not None:
             print(f"\n📅 Temporal Distribution:")
-            year_counts = df['release_year'].value_counts().sort_index()
-            for year, count in year_counts.items():
-                print(f"   {year}: {count:,} tracks")
+            print(format_counts(year_counts))
         
         # Show genre distribution
         print(f"\n📈 Genre Distribution:")
-        genre_counts = df['genre_category'].value_counts()
-        for genre, count in genre_counts.items():
-            print(f"   {genre}: {count:,} tracks")
+        print(format_counts(genre_counts))
         
         # Show artist diversity for larger collections
-        if mode in ["3", "4"] and 'artist_name' in df.columns:
-            artist_counts = df['artist_name'].value_counts()
-            max_songs_per_artist = artist_counts.max()
-            avg_songs_per_artist = len(df) / df['artist_name'].nunique()
+        if mode in ["3", "4"] and artist_counts is not None:
+            # value_counts() is sorted descending, so the first entry is the maximum
+            max_songs_per_artist = artist_counts.iat[0]
+            avg_songs_per_artist = len(df) / artist_counts.size
             print(f"\n👥 Artist Diversity:")
-            print(f"   Total unique artists: {df['artist_name'].nunique():,}")
+            print(f"   Total unique artists: {artist_counts.size:,}")
             print(f"   Average songs per artist: {avg_songs_per_artist:.1f}")
             print(f"   Maximum songs per artist: {max_songs_per_artist}")
     else:
         print(f"\n❌ {mode_name} failed")
-        print("💡 Check data/temp_collection_* directories for any partial data")
+        if collector.stream_path is not None and collector.stream_path.exists():
+            print(f"💡 Genres finished before the failure are in {collector.stream_path}")
+            print("   Use 'Recover Partial Collection' (mode 5) to load them")
     
     input("\nPress Enter to continue...")
 
+@release_frames
 def run_step_3():
     """View dataset."""
     clear_screen()
@@ -303,9 +541,9 @@ def run_step_3():
     print("\n📊 View Dataset")
     print("-" * 40)
     
-    # List available datasets - look for any Spotify CSV files
+    # List available datasets - look for any Spotify CSV or Parquet files
     data_dir = Path("data")
-    datasets = list(data_dir.glob("spotify*.csv"))
+    datasets = find_datasets(data_dir)
     
     if not datasets:
         print("No datasets found")
@@ -315,29 +553,29 @@ def run_step_3():
     for i, dataset in enumerate(datasets, 1):
         print(f"{i}. {dataset.name}")
     
+    prefetched = prefetch_dataset(datasets, SUMMARY_COLUMNS)
     choice = input("\nSelect a dataset (number): ")
     try:
         selected = datasets[int(choice) - 1]
         
-        # Load the dataset directly since we may not have the SpotifyDataLoader
-        df = pd.read_csv(selected)
+        # Read the header and a 5-row preview, then only the columns the summary needs
+        preview = preview_dataset(selected)
+        df = take_dataset(selected, prefetched, SUMMARY_COLUMNS)
         
         print(f"\n📊 Dataset: {selected.name}")
         print("-" * 40)
         print(f"📈 Total rows: {len(df):,}")
-        print(f"📋 Columns: {len(df.columns)}")
+        print(f"📋 Columns: {len(preview.columns)}")
         print(f"💾 File size: {selected.stat().st_size / (1024*1024):.1f} MB")
         
         print(f"\n📋 Column names:")
-        for i, col in enumerate(df.columns, 1):
-            print(f"   {i:2}. {col}")
+        print("\n".join(f"   {i:2}. {col}" for i, col in enumerate(preview.columns, 1)))
         
         print(f"\n📊 Dataset Summary:")
         if 'genre_category' in df.columns:
-            print(f"🎵 Genres: {df['genre_category'].nunique()}")
             genre_counts = df['genre_category'].value_counts()
-            for genre, count in genre_counts.items():
-                print(f"   {genre}: {count:,} tracks")
+            print(f"🎵 Genres: {genre_counts.size}")
+            print(format_counts(genre_counts))
         
         if 'popularity' in df.columns:
             print(f"📈 Popularity: {df['popularity'].mean():.1f} (avg), {df['popularity'].min()}-{df['popularity'].max()} (range)")
@@ -348,14 +586,13 @@ def run_step_3():
         if 'release_year' in df.columns:
             print(f"📅 Years: {df['release_year'].min()}-{df['release_year'].max()}")
             year_counts = df['release_year'].value_counts().sort_index()
-            for year, count in year_counts.items():
-                print(f"   {year}: {count:,} tracks")
+            print(format_counts(year_counts))
         
         print("\n📋 First 5 rows:")
-        print(df.head())
+        print(preview)
         
         print("\n📋 Data types:")
-        print(df.dtypes)
+        print(preview.dtypes)
         
     except (ValueError, IndexError):
         print("Invalid selection")
@@ -364,6 +601,7 @@ def run_step_3():
         
     input("\nPress Enter to continue...")
 
+@release_frames
 def run_step_4():
     """Clean data."""
     clear_screen()
@@ -371,9 +609,9 @@ def run_step_4():
     print("\n🧹 Data Cleaning")
     print("-" * 40)
     
-    # List available datasets - look for any Spotify CSV files
+    # List available datasets - look for any Spotify CSV or Parquet files
     data_dir = Path("data")
-    datasets = list(data_dir.glob("spotify*.csv"))
+    datasets = find_datasets(data_dir)
     
     if not datasets:
         print("No datasets found")
@@ -383,29 +621,34 @@ def run_step_4():
     for i, dataset in enumerate(datasets, 1):
         print(f"{i}. {dataset.name}")
     
+    prefetched = prefetch_dataset(datasets)
     choice = input("\nSelect a dataset to clean (number): ")
     try:
         selected = datasets[int(choice) - 1]
-        df = pd.read_csv(selected)
+        # Cleaned output keeps every column, so no projection here
+        df = take_dataset(selected, prefetched)
         
         # Basic data cleaning since we may not have the SpotifyDataCleaner
         print(f"\n🧹 Cleaning dataset: {selected.name}")
         print(f"📊 Original rows: {len(df):,}")
         
-        # Remove duplicates
-        df_cleaned = df.drop_duplicates()
-        print(f"🔄 After removing duplicates: {len(df_cleaned):,}")
+        # Duplicates are keyed on (track_name, artist_name), matching the validator
+        key_columns = [col for col in ('track_name', 'artist_name') if col in df.columns]
+        keep = ~df.duplicated(subset=key_columns or None)
+        print(f"🔄 After removing duplicates: {keep.sum():,}")
         
         # Remove null values in critical columns
         critical_columns = ['track_name', 'artist_name', 'popularity']
-        before_nulls = len(df_cleaned)
-        df_cleaned = df_cleaned.dropna(subset=[col for col in critical_columns if col in df_cleaned.columns])
-        print(f"🔄 After removing nulls: {len(df_cleaned):,}")
+        keep &= df[[col for col in critical_columns if col in df.columns]].notna().all(axis=1)
+        print(f"🔄 After removing nulls: {keep.sum():,}")
+        
+        # Single selection from the combined mask
+        df_cleaned = df.loc[keep]
         
         # Save cleaned data
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         output_file = f"data/spotify_cleaned_{timestamp}.csv"
-        df_cleaned.to_csv(output_file, index=False)
+        save_csv(df_cleaned, output_file)
         
         print(f"\n✅ Data cleaning complete!")
         print(f"📊 Final rows: {len(df_cleaned):,}")
@@ -416,6 +659,7 @@ def run_step_4():
     except Exception as e:
         print(f"Error cleaning dataset: {e}")
 
+@release_frames
 def run_step_5():
     """Run exploratory analysis - DataCamp Step 5."""
     clear_screen()
@@ -424,9 +668,9 @@ def run_step_5():
     print("-" * 40)
     print("DataCamp Methodology: Understand data patterns before hypothesis testing")
     
-    # List available datasets - look for any Spotify CSV files
+    # List available datasets - look for any Spotify CSV or Parquet files
     data_dir = Path("data")
-    datasets = list(data_dir.glob("spotify*.csv"))
+    datasets = find_datasets(data_dir)
     
     if not datasets:
         print("No datasets found. Please run Step 2: Collect Data first.")
@@ -436,10 +680,11 @@ def run_step_5():
     for i, dataset in enumerate(datasets, 1):
         print(f"{i}. {dataset.name}")
     
+    prefetched = prefetch_dataset(datasets, EDA_COLUMNS)
     choice = input("\nSelect a dataset to analyse (number): ")
     try:
         selected = datasets[int(choice) - 1]
-        df = pd.read_csv(selected)
+        df = take_dataset(selected, prefetched, EDA_COLUMNS)
         
         print(f"\n🔍 Exploratory Data Analysis: {selected.name}")
         print("-" * 50)
@@ -447,51 +692,64 @@ def run_step_5():
         # Basic EDA since we may not have the SpotifyEDA module
         print(f"📊 Dataset Overview:")
         print(f"   Rows: {len(df):,}")
-        print(f"   Columns: {len(df.columns)}")
+        print(f"   Columns loaded: {len(df.columns)}")
+        
+        # One aggregation pass for all summary stats, one for all correlations
+        numeric_cols = [col for col in ('popularity', 'title_length', 'word_count') if col in df.columns]
+        col_stats = df[numeric_cols].agg(['mean', 'median', 'min', 'max', 'std'])
+        corr = df[numeric_cols].corr() if 'popularity' in df.columns else None
         
         if 'popularity' in df.columns:
+            pop = col_stats['popularity']
             print(f"\n📈 Popularity Analysis:")
-            print(f"   Mean: {df['popularity'].mean():.1f}")
-            print(f"   Median: {df['popularity'].median():.1f}")
-            print(f"   Range: {df['popularity'].min()} - {df['popularity'].max()}")
-            print(f"   Std Dev: {df['popularity'].std():.1f}")
+            print(f"   Mean: {pop['mean']:.1f}")
+            print(f"   Median: {pop['median']:.1f}")
+            print(f"   Range: {pop['min']:g} - {pop['max']:g}")
+            print(f"   Std Dev: {pop['std']:.1f}")
         
         if 'title_length' in df.columns:
+            length = col_stats['title_length']
             print(f"\n📏 Title Length Analysis:")
-            print(f"   Mean: {df['title_length'].mean():.1f}")
-            print(f"   Median: {df['title_length'].median():.1f}")
-            print(f"   Range: {df['title_length'].min()} - {df['title_length'].max()}")
+            print(f"   Mean: {length['mean']:.1f}")
+            print(f"   Median: {length['median']:.1f}")
+            print(f"   Range: {length['min']:g} - {length['max']:g}")
             
             # Correlation with popularity
-            if 'popularity' in df.columns:
-                corr = df['title_length'].corr(df['popularity'])
-                print(f"   Correlation with popularity: {corr:.3f}")
+            if corr is not None:
+                print(f"   Correlation with popularity: {corr.at['title_length', 'popularity']:.3f}")
         
         if 'word_count' in df.columns:
+            words = col_stats['word_count']
             print(f"\n📝 Word Count Analysis:")
-            print(f"   Mean: {df['word_count'].mean():.1f}")
-            print(f"   Median: {df['word_count'].median():.1f}")
-            print(f"   Range: {df['word_count'].min()} - {df['word_count'].max()}")
+            print(f"   Mean: {words['mean']:.1f}")
+            print(f"   Median: {words['median']:.1f}")
+            print(f"   Range: {words['min']:g} - {words['max']:g}")
             
             # Correlation with popularity
-            if 'popularity' in df.columns:
-                corr = df['word_count'].corr(df['popularity'])
-                print(f"   Correlation with popularity: {corr:.3f}")
+            if corr is not None:
+                print(f"   Correlation with popularity: {corr.at['word_count', 'popularity']:.3f}")
         
         if 'genre_category' in df.columns:
             print(f"\n🎵 Genre Analysis:")
-            genre_pop = df.groupby('genre_category')['popularity'].agg(['mean', 'count']).round(1)
+            genre_pop = df.groupby('genre_category', observed=True)['popularity'].agg(['mean', 'count']).round(1)
             print(genre_pop)
         
         if 'has_numbers' in df.columns:
             print(f"\n🔢 Numbers in Titles:")
-            with_numbers = df['has_numbers'].sum()
+            has_numbers = df['has_numbers'].astype(bool)
             total = len(df)
+            
+            if 'popularity' in df.columns:
+                # Counts and means for both flag values from one grouped pass
+                number_stats = df['popularity'].groupby(has_numbers).agg(['mean', 'count'])
+                with_numbers = number_stats['count'].get(True, 0)
+            else:
+                with_numbers = has_numbers.sum()
             print(f"   Tracks with numbers: {with_numbers:,} ({100*with_numbers/total:.1f}%)")
             
             if 'popularity' in df.columns:
-                pop_with = df[df['has_numbers'] == True]['popularity'].mean()
-                pop_without = df[df['has_numbers'] == False]['popularity'].mean()
+                pop_with = number_stats['mean'].get(True, float('nan'))
+                pop_without = number_stats['mean'].get(False, float('nan'))
                 print(f"   Avg popularity with numbers: {pop_with:.1f}")
                 print(f"   Avg popularity without numbers: {pop_without:.1f}")
         
@@ -503,6 +761,7 @@ def run_step_5():
     except Exception as e:
         print(f"Error: {e}")
 
+@release_frames
 def run_step_6():
     """Run post-EDA advanced cleaning - DataCamp Step 6."""
     clear_screen()
@@ -511,9 +770,9 @@ def run_step_6():
     print("-" * 40)
     print("DataCamp Methodology: Apply bias correction based on EDA findings")
     
-    # List available datasets - look for any Spotify CSV files
+    # List available datasets - look for any Spotify CSV or Parquet files
     data_dir = Path("data")
-    datasets = list(data_dir.glob("spotify*.csv"))
+    datasets = find_datasets(data_dir)
     
     if not datasets:
         print("No datasets found. Please run Step 2: Collect Data first.")
@@ -524,10 +783,11 @@ def run_step_6():
     for i, dataset in enumerate(datasets, 1):
         print(f"{i}. {dataset.name}")
     
+    prefetched = prefetch_dataset(datasets)
     choice = input("\nSelect a dataset to clean (number): ")
     try:
         selected = datasets[int(choice) - 1]
-        df = pd.read_csv(selected)
+        df = take_dataset(selected, prefetched)
         
         print(f"\n🔧 Post-EDA Cleaning: {selected.name}")
         print("-" * 50)
@@ -586,6 +846,7 @@ def run_step_6():
     
     input("\nPress Enter to continue...")
 
+@release_frames
 def run_step_7():
     """Run hypothesis testing - DataCamp Step 7."""
     clear_screen()
@@ -594,9 +855,9 @@ def run_step_7():
     print("-" * 40)
     print("DataCamp Methodology: Test hypotheses using statistical methods")
     
-    # List available datasets - look for any Spotify CSV files
+    # List available datasets - look for any Spotify CSV or Parquet files
     data_dir = Path("data")
-    datasets = list(data_dir.glob("spotify*.csv"))
+    datasets = find_datasets(data_dir)
     
     if not datasets:
         print("No datasets found. Please run Step 2: Collect Data first.")
@@ -607,10 +868,11 @@ def run_step_7():
     for i, dataset in enumerate(datasets, 1):
         print(f"{i}. {dataset.name}")
     
+    prefetched = prefetch_dataset(datasets)
     choice = input("\nSelect a dataset to test (number): ")
     try:
         selected = datasets[int(choice) - 1]
-        df = pd.read_csv(selected)
+        df = take_dataset(selected, prefetched)
         
         print("\n🔬 Hypothesis Testing Options:")
         print("1. 📏 Title Length vs Popularity")
@@ -660,7 +922,7 @@ def run_step_8():
     print("DataCamp Methodology: Interpret results and draw conclusions")
     
     # List available log files and results
-    log_files = list(Path(".").glob("spotify_analysis*.log"))
+    log_files = scan_files(".", "spotify_analysis", (".log",))
     
     if not log_files:
         print("No results found. Please run Step 7: Hypothesis Testing first.")
@@ -678,9 +940,14 @@ def run_step_8():
         print(f"\n📊 RESULTS FROM: {selected.name}")
         print("=" * 50)
         
-        with open(selected, 'r') as f:
-            content = f.read()
-            print(content)
+        # Only the tail of the log is shown, so never read the whole file
+        with open(selected, 'r', buffering=1 << 20, errors='replace') as f:
+            size = f.seek(0, os.SEEK_END)
+            f.seek(max(0, size - LOG_TAIL_BYTES))
+            if size > LOG_TAIL_BYTES:
+                f.readline()  # Discard the partial first line
+            tail = deque(f, maxlen=LOG_TAIL_LINES)
+        sys.stdout.writelines(tail)
         
         print("\n🎯 CONCLUSION SUMMARY:")
         print("• Hypothesis test results above")
@@ -698,7 +965,7 @@ def run_step_8():
 def test_api_connection():
     """Test the Spotify API connection."""
     try:
-        collector = OptimisedTitleCollector(test_mode=True)
+        collector = get_collector(test_mode=True)
         print("✅ API connection successful!")
         return True
     except Exception as e:
@@ -709,7 +976,7 @@ def validate_dataset():
     """Validate a dataset using Great Expectations."""
     # List available datasets
     data_dir = Path("data")
-    datasets = list(data_dir.glob("spotify_tracks_*.csv"))
+    datasets = find_datasets(data_dir, prefix="spotify_tracks_")
     
     if not datasets:
         print("No datasets found")
@@ -719,10 +986,11 @@ def validate_dataset():
     for i, dataset in enumerate(datasets, 1):
         print(f"{i}. {dataset.name}")
     
+    prefetched = prefetch_dataset(datasets)
     choice = input("\nSelect a dataset to validate (number): ")
     try:
         selected = datasets[int(choice) - 1]
-        df = pd.read_csv(selected)
+        df = take_dataset(selected, prefetched)
         
         # Validate the dataset
         validator = SpotifyDataValidator()
@@ -791,35 +1059,43 @@ def main():
     # Ensure data directory exists
     Path("data").mkdir(exist_ok=True)
     
-    while True:
-        choice = show_menu()
-        
-        if choice == "1":
-            test_api_connection()
-        elif choice == "2":
-            run_step_2()  # Data Collection
-        elif choice == "3":
-            run_step_3()  # View Dataset
-        elif choice == "4":
-            run_step_4()  # Clean Data (Basic)
-        elif choice == "5":
-            run_step_5()  # Exploratory Data Analysis
-        elif choice == "6":
-            run_step_6()  # Advanced Cleaning (Post-EDA)
-        elif choice == "7":
-            run_step_7()  # Statistical Analysis & Hypothesis Testing
-        elif choice == "8":
-            run_step_8()  # Results & Interpretation
-        elif choice == "9":
-            show_project_info()  # Project Info
-        elif choice == "0":
-            print("\n👋 Thank you for using the Spotify Hypothesis Testing tool!")
-            print("🎯 DataCamp methodology complete!")
-            break
-        else:
-            print("❌ Invalid choice. Please try again.")
-        
-        input("\n📍 Press Enter to continue...")
+    if "--no-cache" in sys.argv[1:]:
+        from src.data_collection.search_cache import SearchCache
+        SearchCache().clear()
+        print("🧹 Cleared cached Spotify search responses")
+    
+    try:
+        while True:
+            choice = show_menu()
+            
+            if choice == "1":
+                test_api_connection()
+            elif choice == "2":
+                run_step_2()  # Data Collection
+            elif choice == "3":
+                run_step_3()  # View Dataset
+            elif choice == "4":
+                run_step_4()  # Clean Data (Basic)
+            elif choice == "5":
+                run_step_5()  # Exploratory Data Analysis
+            elif choice == "6":
+                run_step_6()  # Advanced Cleaning (Post-EDA)
+            elif choice == "7":
+                run_step_7()  # Statistical Analysis & Hypothesis Testing
+            elif choice == "8":
+                run_step_8()  # Results & Interpretation
+            elif choice == "9":
+                show_project_info()  # Project Info
+            elif choice == "0":
+                print("\n👋 Thank you for using the Spotify Hypothesis Testing tool!")
+                print("🎯 DataCamp methodology complete!")
+                break
+            else:
+                print("❌ Invalid choice. Please try again.")
+            
+            input("\n📍 Press Enter to continue...")
+    finally:
+        close_collectors()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,186 @@
+"""
+Async Title Collector Module
+
+Drop-in variant of OptimisedTitleCollector that issues Spotify searches from
+an asyncio event loop over a single multiplexed httpx client instead of a
+thread pool of spotipy calls.
+"""
+
+import asyncio
+import json
+import logging
+from typing import Dict
+
+import httpx
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+try:
+    import h2  # noqa: F401 - HTTP/2 support for httpx
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+from .optimised_title_collector import OptimisedTitleCollector, TrackColumns
+
+logger = logging.getLogger(__name__)
+
+SEARCH_URL = "https://api.spotify.com/v1/search"
+
+class AsyncTitleCollector(OptimisedTitleCollector):
+    """Collects Spotify track data with concurrent async searches."""
+
+    def __init__(self, test_mode: bool = False, use_cache: bool = True,
+                 max_concurrency: int = 20):
+        """
+        Initialize the collector.
+
+        Args:
+            test_mode (bool): If True, runs in test mode with reduced limits
+            use_cache (bool): If True, search responses are served from the local cache when available
+            max_concurrency (int): Maximum number of searches in flight at once
+        """
+        super().__init__(test_mode=test_mode, use_cache=use_cache)
+        self.max_concurrency = max_concurrency
+        self.page_size = 50
+        self.max_offset = 500
+
+    def _collect_genre_tracks(self, genre: str) -> TrackColumns:
+        """Collect tracks for a specific genre, running all years on one event loop."""
+        return asyncio.run(self._collect_genre_tracks_async(genre))
+
+    async def _collect_genre_tracks_async(self, genre: str) -> TrackColumns:
+        """Collect every year of a genre concurrently and merge them in year order."""
+        all_genre_tracks = TrackColumns()
+        # (track_name, artist_name) keys already accepted for this genre, filled in year order
+        seen = set()
+
+        print(f"Target tracks for {genre}: {self.target_per_genre}")
+        print(f"Balanced sampling: {self.tracks_per_year} tracks per year")
+
+        limits = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+        async with httpx.AsyncClient(http2=HTTP2_AVAILABLE, limits=limits, timeout=30) as client:
+            self._client = client
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            # spotipy's auth manager does blocking HTTP, so keep it off the event loop
+            self._token = await asyncio.to_thread(self.sp.auth_manager.get_access_token, as_dict=False)
+            try:
+                year_results = await asyncio.gather(*[
+                    self._collect_year_tracks_async(genre, year)
+                    for year in self.years
+                ])
+            finally:
+                self._client = None
+
+        # Cross-year duplicates go to the earliest year, whatever order the searches finished in
+        for year_tracks in year_results:
+            all_genre_tracks.extend_unseen(year_tracks, seen)
+
+        print(f"Final count for {genre}: {len(all_genre_tracks)} tracks")
+        return all_genre_tracks
+
+    async def _collect_year_tracks_async(self, genre: str, year: int) -> TrackColumns:
+        """Collect tracks for one genre and release year."""
+        year_tracks = TrackColumns()
+        # Keys accepted for this year only
+        seen = set()
+        print(f"\n  📅 Collecting {year} tracks (target: {self.tracks_per_year})...")
+
+        # The generic genre query is repeated between specific ones; only fetch it once
+        search_queries = list(dict.fromkeys(
+            query for query_round in self._query_matrix[(genre, year)] for query in query_round
+        ))
+
+        consecutive_empty = 0
+        for search_query in search_queries:
+            if len(year_tracks) >= self.tracks_per_year or consecutive_empty >= self.max_empty_queries:
+                break
+
+            tracks_found = await self._search_tracks_async(search_query, year_tracks, genre, year, seen)
+            if tracks_found > 0:
+                consecutive_empty = 0
+                print(f"    '{search_query}': +{tracks_found} tracks (total: {len(year_tracks)})")
+            else:
+                consecutive_empty += 1
+
+        print(f"  ✅ {year}: Collected {len(year_tracks)} tracks")
+        return year_tracks
+
+    async def _search_tracks_async(self, search_query: str, year_tracks: TrackColumns,
+                                   genre: str, target_year: int, seen: set) -> int:
+        """Search for tracks with a specific query, fetching pages in concurrent waves."""
+        tracks_before = len(year_tracks)
+        offset = 0
+        max_offset = self.max_offset
+
+        while len(year_tracks) < self.tracks_per_year and offset < max_offset:
+            # Request just enough pages to fill the year if every track on them were accepted
+            remaining = self.tracks_per_year - len(year_tracks)
+            pages_needed = -(-remaining // self.page_size)
+            wave_end = min(max_offset, offset + self.page_size * pages_needed)
+            offsets = range(offset, wave_end, self.page_size)
+            results = await asyncio.gather(
+                *[self._search_page(search_query, page_offset) for page_offset in offsets],
+                return_exceptions=True
+            )
+            offset = wave_end
+
+            for result in results:
+                if isinstance(result, Exception):
+                    print(f"    ❌ API error: {str(result)}")
+                    max_offset = 0
+                    break
+
+                tracks = result['tracks']['items']
+                total = result['tracks'].get('total')
+                if total is not None:
+                    max_offset = min(max_offset, total)
+
+                self._add_page_tracks(tracks, year_tracks, genre, target_year, seen)
+                # A short page is the last page
+                if len(tracks) < self.page_size:
+                    max_offset = 0
+                    break
+
+        return len(year_tracks) - tracks_before
+
+    async def _search_page(self, search_query: str, offset: int) -> Dict:
+        """Run one track search, reusing a cached response when one exists."""
+        if self.search_cache is not None:
+            cached = await asyncio.to_thread(self.search_cache.get, search_query, 'track', self.page_size, offset)
+            if cached is not None:
+                return cached
+
+        params = {'q': search_query, 'type': 'track', 'limit': self.page_size, 'offset': offset}
+        async with self._semaphore:
+            for attempt in range(self.max_retries + 1):
+                await asyncio.sleep(self.rate_limiter.reserve())
+                response = await self._client.get(
+                    SEARCH_URL, params=params,
+                    headers={'Authorization': f"Bearer {self._token}"}
+                )
+
+                if response.status_code == 401 and attempt < self.max_retries:
+                    # Token expired mid-run; have spotipy's auth manager fetch a fresh one
+                    self._token = await asyncio.to_thread(
+                        self.sp.auth_manager.get_access_token, as_dict=False, check_cache=False
+                    )
+                    continue
+                if response.status_code in (429, 500, 502, 503, 504) and attempt < self.max_retries:
+                    retry_after = response.headers.get('Retry-After')
+                    delay = float(retry_after) if retry_after else self.retry_delay * 2 ** attempt
+                    logger.warning(f"Search returned {response.status_code}, retrying in {delay:.1f}s")
+                    await asyncio.sleep(delay)
+                    continue
+
+                response.raise_for_status()
+                break
+
+        results = _loads(response.content)
+        if self.search_cache is not None:
+            await asyncio.to_thread(self.search_cache.set, search_query, 'track', self.page_size, offset, results)
+        return results
@@ -10,15 +10,25 @@ import spotipy
 from spotipy.oauth2 import SpotifyClientCredentials
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional, Tuple
+import pyarrow as pa
+import pyarrow.parquet as pq
+from typing import Dict, List, Optional
 import logging
 from pathlib import Path
 import os
+import sys
 from datetime import datetime
 import time
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 
+from .search_cache import SearchCache
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -26,15 +36,122 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Spotify access tokens last an hour; refresh well before that
+TOKEN_REFRESH_INTERVAL = 50 * 60
+
+# Characters str.isdigit accepts beyond \p{Nd}: the digit-valued part of \p{No} (superscripts,
+# subscripts, circled and parenthesised digits, ...), which leaves out fractions such as '½'
+_OTHER_DIGIT_RANGES = (
+    (0x00B2, 0x00B3), (0x00B9, 0x00B9), (0x1369, 0x1371), (0x19DA, 0x19DA), (0x2070, 0x2070),
+    (0x2074, 0x2079), (0x2080, 0x2089), (0x2460, 0x2468), (0x2474, 0x247C), (0x2488, 0x2490),
+    (0x24EA, 0x24EA), (0x24F5, 0x24FD), (0x24FF, 0x24FF), (0x2776, 0x277E), (0x2780, 0x2788),
+    (0x278A, 0x2792), (0x10A40, 0x10A43), (0x10E60, 0x10E68), (0x11052, 0x1105A), (0x1F100, 0x1F10A),
+)
+
+# Unicode digits as str.isdigit defines them (e.g. '٣', '²', '①') and whitespace (including
+# separators such as U+3000 and U+00A0, plus the controls str.isspace accepts) for the title flags
+UNICODE_DIGIT_PATTERN = (
+    r'[\p{Nd}' + ''.join(rf'\x{{{low:X}}}-\x{{{high:X}}}' for low, high in _OTHER_DIGIT_RANGES) + ']'
+)
+UNICODE_SPACE_PATTERN = r'[\s\p{Z}\x0b\x1c-\x1f\x85]+'
+
+def _run_token_refresh(refresh_ref: weakref.WeakMethod, force: bool):
+    """Timer callback; does nothing once the collector has been garbage collected."""
+    refresh = refresh_ref()
+    if refresh is not None:
+        refresh(force=force)
+
+class RateLimiter:
+    """Thread-safe token bucket shared by all search workers."""
+    
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        """
+        Args:
+            rate (float): Requests allowed per second on average
+            burst (int, optional): Maximum requests allowed back-to-back
+        """
+        self.rate = rate
+        self.capacity = burst or max(1, int(rate))
+        self._tokens = float(self.capacity)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def reserve(self) -> float:
+        """Claim the next request slot and return how many seconds to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            # Tokens may go negative: each caller queues behind the slots already reserved
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self.rate)
+    
+    def acquire(self):
+        """Block until a request may be sent."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+class TrackColumns:
+    """Column-wise accumulator for collected tracks (one list per field)."""
+    
+    FIELDS = ('track_name', 'artist_name', 'popularity', 'duration_ms',
+              'genre_category', 'release_year')
+    SCHEMA = pa.schema([
+        ('track_name', pa.string()),
+        ('artist_name', pa.string()),
+        ('popularity', pa.uint8()),
+        ('duration_ms', pa.uint32()),
+        ('genre_category', pa.string()),
+        ('release_year', pa.uint16())
+    ])
+    
+    def __init__(self):
+        self.columns = {field: [] for field in self.FIELDS}
+    
+    def __len__(self) -> int:
+        return len(self.columns['track_name'])
+    
+    def append(self, track_name: str, artist_name: str, popularity: int,
+               duration_ms: int, genre_category: str, release_year: int):
+        """Add one track."""
+        columns = self.columns
+        columns['track_name'].append(track_name)
+        columns['artist_name'].append(artist_name)
+        columns['popularity'].append(popularity)
+        columns['duration_ms'].append(duration_ms)
+        columns['genre_category'].append(genre_category)
+        columns['release_year'].append(release_year)
+    
+    def extend(self, other: "TrackColumns"):
+        """Add every track from another accumulator."""
+        for field, values in other.columns.items():
+            self.columns[field].extend(values)
+    
+    def extend_unseen(self, other: "TrackColumns", seen: set):
+        """Add the tracks from another accumulator whose (track_name, artist_name) key is not in seen."""
+        keep = []
+        for i, key in enumerate(zip(other.columns['track_name'], other.columns['artist_name'])):
+            if key not in seen:
+                seen.add(key)
+                keep.append(i)
+        for field, values in other.columns.items():
+            self.columns[field].extend([values[i] for i in keep])
+    
+    def to_table(self) -> pa.Table:
+        """Build a typed Arrow table straight from the column lists."""
+        return pa.Table.from_pydict(self.columns, schema=self.SCHEMA)
+
 class OptimisedTitleCollector:
     """Collects Spotify track data with a focus on title analysis."""
     
-    def __init__(self, test_mode: bool = False):
+    def __init__(self, test_mode: bool = False, use_cache: bool = True):
         """
         Initialize the collector.
         
         Args:
             test_mode (bool): If True, runs in test mode with reduced limits
+            use_cache (bool): If True, search responses are served from the local cache when available
         """
         self.test_mode = test_mode
         # 8 specific genres as requested
@@ -46,6 +163,15 @@ class OptimisedTitleCollector:
         self.target_per_genre = None
         self.max_retries = 3
         self.retry_delay = 1
+        # A year is treated as saturated after this many queries in a row add nothing new
+        self.max_empty_queries = 3
+        # Years are searched concurrently; the limiter keeps the whole pool under Spotify's quota
+        self.max_workers = 8
+        self.rate_limiter = RateLimiter(rate=10)
+        self.search_cache = SearchCache() if use_cache else None
+        # Raw tracks are streamed here genre by genre, so finished genres survive a crash;
+        # collect_tracks() points it at a new timestamped file for every run
+        self.stream_path = None
         self._setup_spotify_client()
         self._setup_collection_parameters()
     
@@ -53,6 +179,9 @@ class OptimisedTitleCollector:
         """Setup collection parameters based on mode."""
         # Balanced temporal sampling parameters
         self.years = [2024, 2023, 2022, 2021, 2020]
+        # Release dates are compared as 'YYYY' prefixes, so keep each year's string form
+        self._year_str_cache = {year: str(year) for year in self.years}
+        self._build_query_matrix()
         
         if self.test_mode:
             # Test mode: 2 tracks per year = 10 tracks per genre (~80 total)
@@ -63,6 +192,19 @@ class OptimisedTitleCollector:
             self.tracks_per_year = 400
             self.target_per_genre = 2000
     
+    def _build_query_matrix(self):
+        """Format every (genre, year) search query once, up front."""
+        # Each round pairs one specific genre query with the generic one for that genre and year
+        self.genres = [sys.intern(genre) for genre in self.genres]
+        self._query_matrix = {}
+        for genre in self.genres:
+            for year in self.years:
+                generic_query = f"year:{year} genre:{genre}"
+                self._query_matrix[(genre, year)] = [
+                    (f"year:{year} {query}", generic_query)
+                    for query in self.genre_categories[genre]
+                ]
+    
     def set_collection_size(self, size: str):
         """
         Set collection size after initialization.
@@ -90,6 +232,45 @@ class OptimisedTitleCollector:
         print(f"   Target per genre: {self.target_per_genre}")
         print(f"   Expected total: ~{self.target_per_genre * len(self.genres):,}")
 
+    def _schedule_token_refresh(self, delay: float, force: bool = True):
+        """Fetch an access token after `delay` seconds on a daemon timer."""
+        # The timer only holds a weak reference, so a pending refresh never keeps the collector alive
+        timer = threading.Timer(
+            delay, _run_token_refresh, args=(weakref.WeakMethod(self._refresh_token), force)
+        )
+        timer.daemon = True
+        self._token_timer = timer
+        timer.start()
+    
+    def _refresh_token(self, force: bool = True):
+        """Fetch an access token, then schedule the next refresh."""
+        if self._token_timer is None:
+            return  # Collector was closed
+        try:
+            self.sp.auth_manager.get_access_token(as_dict=False, check_cache=not force)
+        except Exception as e:
+            logger.warning(f"Background token refresh failed: {e}")
+        if self._token_timer is not None:
+            self._schedule_token_refresh(TOKEN_REFRESH_INTERVAL)
+
+    def close(self):
+        """Stop the token refresh timer and close the pooled HTTP session."""
+        timer = getattr(self, '_token_timer', None)
+        if timer is not None:
+            timer.cancel()
+            self._token_timer = None
+        
+        session = getattr(self, '_http_session', None)
+        if session is not None:
+            session.close()
+            self._http_session = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def collect_tracks(self, target_per_genre: Optional[int] = None) -> Optional[pd.DataFrame]:
         """
         Collect tracks from Spotify API.
@@ -108,48 +289,28 @@ class OptimisedTitleCollector:
             if self.tracks_per_year == 0:
                 self.tracks_per_year = 1  # Minimum 1 per year
         
-        all_tracks = []
-        total_tracks = 0
-        
         mode_name = "�� TEST MODE" if self.tracks_per_year <= 20 else "🧪 MEDIUM MODE" if self.tracks_per_year <= 100 else "📥 FULL COLLECTION MODE" if self.tracks_per_year <= 800 else "🚀 MEGA COLLECTION MODE"
         print(f"\n{mode_name}")
         print(f"Target tracks per genre: {self.target_per_genre}")
         print(f"Balanced sampling: {self.tracks_per_year} tracks per year")
         print("-" * 40)
         
+        # Each run gets its own file, so a later run never overwrites an earlier run's tracks
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.stream_path = Path("data") / f"tracks_{timestamp}.parquet"
+        
         try:
-            for genre in self.genres:
-                print(f"\nCollecting {genre} tracks...")
-                genre_tracks = self._collect_genre_tracks(genre)
-                
-                if genre_tracks:
-                    all_tracks.extend(genre_tracks)
-                    total_tracks += len(genre_tracks)
-                    
-                    print(f"✅ Collected {len(genre_tracks)} {genre} tracks")
-                    print(f"   Average popularity: {np.mean([t['popularity'] for t in genre_tracks]):.1f}")
-                    print(f"   Average title length: {np.mean([len(t['track_name']) for t in genre_tracks]):.1f}")
-                    
-                    # Show artist diversity stats
-                    unique_artists = len(set(t['artist_name'] for t in genre_tracks))
-                    print(f"   Unique artists: {unique_artists}")
-                    if len(genre_tracks) > 0:
-                        avg_songs_per_artist = len(genre_tracks) / unique_artists
-                        print(f"   Avg songs per artist: {avg_songs_per_artist:.1f}")
-                else:
-                    print(f"❌ Failed to collect {genre} tracks")
+            self.stream_path.parent.mkdir(parents=True, exist_ok=True)
+            with pq.ParquetWriter(self.stream_path, TrackColumns.SCHEMA, compression='zstd') as writer:
+                self._collect_all_genres(writer)
             
-            if not all_tracks:
+            if pq.read_metadata(self.stream_path).num_rows == 0:
                 print("\n❌ No tracks were collected")
+                self._discard_empty_stream()
                 return None
-                
-            df = pd.DataFrame(all_tracks)
             
-            # Add title analysis columns (if not already calculated)
-            if 'title_length' not in df.columns:
-                df['title_length'] = df['track_name'].str.len()
-            if 'word_count' not in df.columns:
-                df['word_count'] = df['track_name'].str.split().str.len()
+            # Only one genre was ever held in memory; load the finished dataset back in one read
+            df = self.load_stream(self.stream_path)
             
             print(f"\n📊 Collection Summary:")
             print(f"Total tracks: {len(df):,}")
@@ -162,15 +323,105 @@ class OptimisedTitleCollector:
             
         except Exception as e:
             print(f"\n❌ Collection failed: {e}")
+            self._discard_empty_stream()
         return None
 
+    def _discard_empty_stream(self):
+        """Delete this run's stream file if no genre made it into it, so there is nothing to recover."""
+        try:
+            if pq.read_metadata(self.stream_path).num_rows > 0:
+                return
+        except (OSError, pa.ArrowInvalid):
+            pass  # Missing, or the run failed before the writer finished the file
+        self.stream_path.unlink(missing_ok=True)
+
+    def load_stream(self, path) -> pd.DataFrame:
+        """Load a streamed tracks file with its title features, e.g. to recover a failed run."""
+        df = pq.read_table(path).to_pandas()
+        df = self._add_title_features(df)
+        return self._downcast_columns(df)
+
+    def _collect_all_genres(self, writer: pq.ParquetWriter):
+        """Collect every genre, appending each one to the Parquet stream as it finishes."""
+        for genre in self.genres:
+            print(f"\nCollecting {genre} tracks...")
+            genre_tracks = self._collect_genre_tracks(genre)
+            
+            if genre_tracks:
+                writer.write_table(genre_tracks.to_table())
+                
+                print(f"✅ Collected {len(genre_tracks)} {genre} tracks")
+                print(f"   Average popularity: {np.mean(genre_tracks.columns['popularity']):.1f}")
+                print(f"   Average title length: {np.mean([len(name) for name in genre_tracks.columns['track_name']]):.1f}")
+                
+                # Show artist diversity stats
+                unique_artists = len(set(genre_tracks.columns['artist_name']))
+                print(f"   Unique artists: {unique_artists}")
+                if len(genre_tracks) > 0:
+                    avg_songs_per_artist = len(genre_tracks) / unique_artists
+                    print(f"   Avg songs per artist: {avg_songs_per_artist:.1f}")
+            else:
+                print(f"❌ Failed to collect {genre} tracks")
+
+    @staticmethod
+    def _add_title_features(df: pd.DataFrame) -> pd.DataFrame:
+        """Compute title features with vectorised string ops, in the dataset's column order."""
+        # Arrow-backed so the regexes run on RE2, whose \p{...} classes cover all of Unicode
+        # like the str.isdigit / str.isspace checks these flags were defined with
+        titles = df['track_name'].astype(pd.StringDtype('pyarrow'))
+        # A title has special characters if, ignoring whitespace, it is not purely alphanumeric
+        non_space = titles.str.replace(UNICODE_SPACE_PATTERN, '', regex=True)
+        features = pd.DataFrame({
+            'title_length': titles.str.len(),
+            'word_count': titles.str.split().str.len(),
+            'has_numbers': titles.str.contains(UNICODE_DIGIT_PATTERN, regex=True),
+            'has_special_chars': ~(non_space.str.isalnum() | (non_space == ''))
+        }, index=df.index)
+        
+        position = df.columns.get_loc('duration_ms') + 1
+        return pd.concat([df.iloc[:, :position], features, df.iloc[:, position:]], axis=1)
+
+    @staticmethod
+    def _downcast_columns(df: pd.DataFrame) -> pd.DataFrame:
+        """Shrink columns to the smallest dtypes that hold their value ranges."""
+        df['popularity'] = df['popularity'].astype('uint8')  # 0-100
+        df['release_year'] = df['release_year'].astype('uint16')
+        df['duration_ms'] = df['duration_ms'].astype('uint32')
+        # Title lengths are unbounded in principle, so let pandas pick a type that fits
+        df['title_length'] = pd.to_numeric(df['title_length'], downcast='unsigned')
+        df['word_count'] = pd.to_numeric(df['word_count'], downcast='unsigned')
+        df['genre_category'] = df['genre_category'].astype('category')
+        return df
+
     def _setup_spotify_client(self):
+        # Shared keep-alive session so every search reuses pooled HTTPS connections
+        self._http_session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=self.max_retries,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=None  # Token requests are POSTs and are safe to retry
+            )
+        )
+        self._http_session.mount('https://', adapter)
+        
         # Initialize Spotify client
         client_credentials_manager = SpotifyClientCredentials(
             client_id=os.getenv('SPOTIPY_CLIENT_ID'),
-            client_secret=os.getenv('SPOTIPY_CLIENT_SECRET')
+            client_secret=os.getenv('SPOTIPY_CLIENT_SECRET'),
+            requests_session=self._http_session
+        )
+        self.sp = spotipy.Spotify(
+            client_credentials_manager=client_credentials_manager,
+            requests_session=self._http_session
         )
-        self.sp = spotipy.Spotify(client_credentials_manager=client_credentials_manager)
+        
+        # Fetch the token in the background now rather than inside the first search
+        self._token_timer = None
+        self._schedule_token_refresh(0, force=False)
         
         # Genre search strategies
         self.genre_categories = {
@@ -214,123 +465,111 @@ class OptimisedTitleCollector:
             ]
         }
     
-    def _collect_genre_tracks(self, genre: str) -> List[Dict]:
+    def _collect_genre_tracks(self, genre: str) -> TrackColumns:
         """Collect tracks for a specific genre with balanced temporal sampling."""
-        all_genre_tracks = []
+        all_genre_tracks = TrackColumns()
         genre_queries = self.genre_categories[genre]
+        # (track_name, artist_name) keys already accepted for this genre, filled in year order
+        seen = set()
         
         print(f"Target tracks for {genre}: {self.target_per_genre}")
         print(f"Balanced sampling: {self.tracks_per_year} tracks per year")
         
-        # Collect tracks per year
-        for year in self.years:
-            year_tracks = []
-            print(f"\n  📅 Collecting {year} tracks (target: {self.tracks_per_year})...")
-            
-            query_index = 0
-            attempts = 0
-            max_attempts = len(genre_queries) * 3
+        # Years are independent, so search them concurrently (results keep year order)
+        workers = min(self.max_workers, len(self.years))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            year_results = executor.map(
+                lambda year: self._collect_year_tracks(genre, genre_queries, year),
+                self.years
+            )
+            # Cross-year duplicates go to the earliest year, whatever order the workers finished in
+            for year_tracks in year_results:
+                all_genre_tracks.extend_unseen(year_tracks, seen)
+        
+        print(f"Final count for {genre}: {len(all_genre_tracks)} tracks")
+        return all_genre_tracks
+    
+    def _collect_year_tracks(self, genre: str, genre_queries: List[str], year: int) -> TrackColumns:
+        """Collect tracks for one genre and release year."""
+        year_tracks = TrackColumns()
+        # Keys accepted for this year only; no other thread touches it
+        seen = set()
+        print(f"\n  📅 Collecting {year} tracks (target: {self.tracks_per_year})...")
+        
+        query_rounds = self._query_matrix[(genre, year)]
+        
+        query_index = 0
+        attempts = 0
+        max_attempts = len(genre_queries) * 3
+        consecutive_empty = 0
+        
+        while (len(year_tracks) < self.tracks_per_year and attempts < max_attempts
+               and consecutive_empty < self.max_empty_queries):
+            search_queries = query_rounds[query_index % len(query_rounds)]
             
-            while len(year_tracks) < self.tracks_per_year and attempts < max_attempts:
-                query = genre_queries[query_index % len(genre_queries)]
-                
-                search_queries = [
-                    f"year:{year} {query}",
-                    f"year:{year} genre:{genre}"
-                ]
-                
-                for search_query in search_queries:
-                    if len(year_tracks) >= self.tracks_per_year:
-                        break
-                        
-                    tracks_found = self._search_tracks(
-                        search_query, year_tracks, genre, year
-                    )
+            for search_query in search_queries:
+                if len(year_tracks) >= self.tracks_per_year or consecutive_empty >= self.max_empty_queries:
+                    break
                     
-                    if tracks_found > 0:
-                        print(f"    '{search_query}': +{tracks_found} tracks (total: {len(year_tracks)})")
+                tracks_found = self._search_tracks(
+                    search_query, year_tracks, genre, year, seen
+                )
                 
-                query_index += 1
-                attempts += 1
+                if tracks_found > 0:
+                    consecutive_empty = 0
+                    print(f"    '{search_query}': +{tracks_found} tracks (total: {len(year_tracks)})")
+                else:
+                    consecutive_empty += 1
             
-            print(f"  ✅ {year}: Collected {len(year_tracks)} tracks")
-            all_genre_tracks.extend(year_tracks)
+            query_index += 1
+            attempts += 1
         
-        print(f"Final count for {genre}: {len(all_genre_tracks)} tracks")
-        return all_genre_tracks
+        print(f"  ✅ {year}: Collected {len(year_tracks)} tracks")
+        return year_tracks
+    
+    def _cached_search(self, search_query: str, limit: int, offset: int) -> Dict:
+        """Run a track search, reusing a cached response when one exists."""
+        if self.search_cache is not None:
+            cached = self.search_cache.get(search_query, 'track', limit, offset)
+            if cached is not None:
+                return cached
+        
+        self.rate_limiter.acquire()
+        results = self.sp.search(q=search_query, type='track', limit=limit, offset=offset)
+        
+        if self.search_cache is not None:
+            self.search_cache.set(search_query, 'track', limit, offset, results)
+        return results
     
-    def _search_tracks(self, search_query: str, year_tracks: List[Dict], 
-                      genre: str, target_year: int) -> int:
+    def _search_tracks(self, search_query: str, year_tracks: TrackColumns, 
+                      genre: str, target_year: int, seen: set) -> int:
         """Search for tracks with a specific query."""
         tracks_before = len(year_tracks)
         
         try:
             offset = 0
+            page_size = 50
             max_offset = 500  # Reasonable limit
             
             while len(year_tracks) < self.tracks_per_year and offset < max_offset:
                 try:
-                    results = self.sp.search(
-                        q=search_query,
-                        type='track',
-                        limit=50,
-                        offset=offset
-                    )
+                    results = self._cached_search(search_query, limit=page_size, offset=offset)
                     
                     tracks = results['tracks']['items']
                     if not tracks:
                         break
                     
-                    for track in tracks:
-                        if len(year_tracks) >= self.tracks_per_year:
-                            break
-                        
-                        # Extract track info
-                        track_name = track['name']
-                        artist_name = track['artists'][0]['name']
-                        
-                        # Skip duplicates
-                        if any(t['track_name'] == track_name and t['artist_name'] == artist_name 
-                              for t in year_tracks):
-                            continue
-                        
-                        # Verify release year
-                        try:
-                            album_date = track['album']['release_date']
-                            if album_date:
-                                release_year = int(album_date[:4])
-                                if release_year != target_year:
-                                    continue
-                        except (ValueError, KeyError):
-                            continue
-                        
-                        # Quality filters
-                        popularity = track['popularity']
-                        if popularity < 15:
-                            continue
-                        
-                        # Calculate title features
-                        title_length = len(track_name)
-                        word_count = len(track_name.split())
-                        has_numbers = any(c.isdigit() for c in track_name)
-                        has_special_chars = any(not c.isalnum() and not c.isspace() for c in track_name)
-                        
-                        # Add the track
-                        year_tracks.append({
-                            'track_name': track_name,
-                            'artist_name': artist_name,
-                            'popularity': popularity,
-                            'duration_ms': track['duration_ms'],
-                            'title_length': title_length,
-                            'word_count': word_count,
-                            'has_numbers': has_numbers,
-                            'has_special_chars': has_special_chars,
-                            'genre_category': genre,
-                            'release_year': target_year
-                        })
+                    # Never page past the number of results Spotify reports for this query
+                    total = results['tracks'].get('total')
+                    if total is not None:
+                        max_offset = min(max_offset, total)
+                    
+                    self._add_page_tracks(tracks, year_tracks, genre, target_year, seen)
                     
                     offset += len(tracks)
-                    time.sleep(0.1)  # Rate limiting
+                    # A short page is the last page
+                    if len(tracks) < page_size:
+                        break
                     
                 except Exception as e:
                     print(f"    ❌ API error: {str(e)}")
@@ -340,4 +579,43 @@ class OptimisedTitleCollector:
             print(f"    ❌ Search failed for {search_query}: {str(e)}")
         
         tracks_found = len(year_tracks) - tracks_before
-        return tracks_found 
\ No newline at end of file
+        return tracks_found
+    
+    def _add_page_tracks(self, tracks: List[Dict], year_tracks: TrackColumns,
+                         genre: str, target_year: int, seen: set):
+        """Filter one page of search results into year_tracks."""
+        target_year_str = self._year_str_cache.get(target_year) or str(target_year)
+        
+        for track in tracks:
+            if len(year_tracks) >= self.tracks_per_year:
+                break
+            
+            # Extract track info
+            track_name = track['name']
+            artist_name = track['artists'][0]['name']
+            
+            # Skip duplicates
+            key = (track_name, artist_name)
+            if key in seen:
+                continue
+            
+            # Verify release year
+            try:
+                album_date = track['album']['release_date']
+                if album_date and album_date[:4] != target_year_str:
+                    continue
+            except KeyError:
+                continue
+            
+            # Quality filters
+            popularity = track['popularity']
+            if popularity < 15:
+                continue
+            
+            seen.add(key)
+            
+            # Add the track (title features are computed in bulk in collect_tracks)
+            year_tracks.append(
+                track_name, artist_name, popularity,
+                track['duration_ms'], genre, target_year
+            )
@@ -0,0 +1,99 @@
+"""
+Search Cache Module
+
+Two-level cache for Spotify search responses: an in-process LRU in front of
+JSON files on disk, so repeated queries across menu runs and restarts are
+served locally instead of re-hitting the API.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+class SearchCache:
+    """Caches Spotify search responses in memory and on disk."""
+
+    def __init__(self, cache_dir: str = "data/.spotify_cache",
+                 expire_after: int = 7 * 24 * 3600, max_memory_items: int = 4096):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir (str): Directory holding one JSON file per cached response
+            expire_after (int): Seconds before a disk entry is considered stale
+            max_memory_items (int): Size of the in-process LRU
+        """
+        self.cache_dir = Path(cache_dir)
+        self.expire_after = expire_after
+        self.max_memory_items = max_memory_items
+        self._memory: "OrderedDict[str, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _make_key(query: str, search_type: str, limit: int, offset: int) -> str:
+        """Build a filesystem-safe key for a search request."""
+        raw = json.dumps([query, search_type, limit, offset])
+        return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+    def get(self, query: str, search_type: str, limit: int, offset: int) -> Optional[Dict]:
+        """Return a cached response, or None if it is missing or expired."""
+        key = self._make_key(query, search_type, limit, offset)
+
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key]
+
+        path = self.cache_dir / f"{key}.json"
+        try:
+            if time.time() - path.stat().st_mtime > self.expire_after:
+                return None
+            with open(path, 'r', encoding='utf-8') as f:
+                results = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        self._remember(key, results)
+        return results
+
+    def set(self, query: str, search_type: str, limit: int, offset: int, results: Dict):
+        """Store a response in memory and on disk."""
+        key = self._make_key(query, search_type, limit, offset)
+        self._remember(key, results)
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            path = self.cache_dir / f"{key}.json"
+            # Write to a temp file first so concurrent readers never see a partial entry
+            tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(results, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write search cache entry: {e}")
+
+    def clear(self):
+        """Remove every cached response."""
+        with self._lock:
+            self._memory.clear()
+
+        if self.cache_dir.exists():
+            for path in self.cache_dir.glob("*.json"):
+                path.unlink(missing_ok=True)
+        logger.info(f"Cleared search cache at {self.cache_dir}")
+
+    def _remember(self, key: str, results: Dict):
+        """Add an entry to the in-process LRU, evicting the oldest if full."""
+        with self._lock:
+            self._memory[key] = results
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_memory_items:
+                self._memory.popitem(last=False)
@@ -6,24 +6,151 @@ This module handles comprehensive data cleaning for title complexity analysis,
 including missing value treatment, outlier detection, and feature validation.
 """
 
+import hashlib
+import os
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
 import logging
-from typing import Dict, List, Tuple
+from pathlib import Path
+from typing import Dict, List, Optional
 from scipy import stats
 
+try:
+    import polars as pl
+    POLARS_AVAILABLE = True
+except ImportError:
+    POLARS_AVAILABLE = False
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Shared settings for the row-cleaning stages
+KEY_COLUMNS = ['track_name', 'artist_name', 'popularity', 'duration_ms', 'genre_category']
+NUMERIC_COLUMNS = ['popularity', 'duration_ms', 'title_length', 'word_count']
+BOOL_COLUMNS = ['has_numbers', 'has_special_chars']
+TYPED_COLUMNS = frozenset(NUMERIC_COLUMNS + BOOL_COLUMNS)
+VALID_RANGES = {
+    'popularity': (0, 100),
+    'duration_ms': (0, 3600000),  # 1 hour max
+    'title_length': (0, 200),     # 200 characters max
+    'word_count': (0, 50)         # 50 words max
+}
+
+# Bin edges for the derived group columns, kept as float arrays so pd.cut uses them as-is
+TITLE_LENGTH_BINS = np.array([0, 20, 40, 60, np.inf])
+TITLE_LENGTH_LABELS = ['Very Short (0-20)', 'Short (21-40)', 'Medium (41-60)', 'Long (60+)']
+WORD_COUNT_BINS = np.array([0, 2, 4, np.inf])
+WORD_COUNT_LABELS = ['Short (1-2 words)', 'Medium (3-4 words)', 'Long (5+ words)']
+POPULARITY_BINS = np.array([0, 20, 40, 60, 80, 100], dtype=np.float64)
+POPULARITY_LABELS = ['Very Low (0-20)', 'Low (21-40)', 'Medium (41-60)', 'High (61-80)', 'Very High (81-100)']
+
+# Dtypes pd.cut produces for the group columns; later stages reuse columns that already match
+TITLE_LENGTH_DTYPE = pd.CategoricalDtype(TITLE_LENGTH_LABELS, ordered=True)
+WORD_COUNT_DTYPE = pd.CategoricalDtype(WORD_COUNT_LABELS, ordered=True)
+
+# Title feature combinations, indexed by has_numbers * 2 + has_special_chars
+TITLE_FEATURE_GROUPS = np.array([
+    'No Numbers, No Special Chars',
+    'No Numbers, Has Special Chars',
+    'Has Numbers, No Special Chars',
+    'Has Numbers, Has Special Chars'
+])
+
+# Columns tested for normality and group columns tested for equal popularity variance
+NORMALITY_COLUMNS = ['title_length', 'word_count', 'popularity']
+VARIANCE_GROUP_COLUMNS = ['word_count_group', 'title_feature_group']
+
+# Bump when the cleaning logic changes; together with the rule constants above it is part of
+# the cleaned-frame cache key, so cached frames from older rules are never served
+CLEANING_CACHE_VERSION = 1
+_CLEANING_RULES = repr((
+    CLEANING_CACHE_VERSION, KEY_COLUMNS, NUMERIC_COLUMNS, BOOL_COLUMNS, sorted(VALID_RANGES.items()),
+    TITLE_LENGTH_BINS.tolist(), TITLE_LENGTH_LABELS, WORD_COUNT_BINS.tolist(), WORD_COUNT_LABELS,
+    POPULARITY_BINS.tolist(), POPULARITY_LABELS, TITLE_FEATURE_GROUPS.tolist()
+))
+
+def _groups_by_code(values: np.ndarray, codes: np.ndarray, n_groups: int) -> List[np.ndarray]:
+    """Split values into one array per group code after a single sort (codes of -1 are dropped)"""
+    order = np.argsort(codes, kind='stable')
+    sorted_codes = codes[order]
+    return np.split(values[order], np.searchsorted(sorted_codes, np.arange(n_groups)))[1:]
+
+def _assumptions_key(df: pd.DataFrame) -> str:
+    """Digest of the columns the assumption tests read, so cached results follow their content"""
+    columns = [col for col in dict.fromkeys(NORMALITY_COLUMNS + ['popularity'] + VARIANCE_GROUP_COLUMNS)
+               if col in df.columns]
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update('\x1f'.join(columns).encode('utf-8'))
+    digest.update(pd.util.hash_pandas_object(df[columns], index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+def _compute_assumptions(df: pd.DataFrame) -> Dict:
+    """
+    Run the normality and equal-variance tests shared by the cleaner and EDA
+    Results are cached in df.attrs['stat_assumptions'], keyed by the tested columns' content,
+    since pandas carries attrs over to frames derived with assign, clip, selections, ...
+    Args:
+        df: Cleaned DataFrame
+    Returns:
+        Dictionary with the normality test used and per-column / per-grouping statistics
+    """
+    key = _assumptions_key(df)
+    cached = df.attrs.get('stat_assumptions')
+    if cached is not None and cached.get('key') == key:
+        return cached
+    
+    # Shapiro-Wilk for smaller samples, D'Agostino-Pearson for larger
+    if len(df) < 5000:
+        test, test_name = stats.shapiro, "Shapiro-Wilk"
+    else:
+        test, test_name = stats.normaltest, "D'Agostino-Pearson"
+    
+    normality = {}
+    columns = [col for col in NORMALITY_COLUMNS if col in df.columns]
+    if test is stats.normaltest and columns:
+        # Skew and kurtosis are computed column-wise over one (n, k) array, so every column
+        # is tested in a single vectorised call rather than one pass per column
+        statistics, p_values = test(df[columns].to_numpy(dtype=np.float64), axis=0)
+        for col, statistic, p_value in zip(columns, statistics, p_values):
+            normality[col] = {'statistic': float(statistic), 'p_value': float(p_value)}
+    else:
+        for col in columns:
+            statistic, p_value = test(df[col].to_numpy(dtype=np.float64))
+            normality[col] = {'statistic': float(statistic), 'p_value': float(p_value)}
+    
+    variance = {}
+    popularity = df['popularity'].to_numpy(dtype=np.float64)
+    for col in VARIANCE_GROUP_COLUMNS:
+        if col in df.columns:
+            codes, labels = pd.factorize(df[col])
+            groups = _groups_by_code(popularity, codes, len(labels))
+            statistic, p_value = stats.levene(*groups)
+            variance[col] = {'statistic': float(statistic), 'p_value': float(p_value)}
+    
+    assumptions = {'key': key, 'rows': len(df), 'test_used': test_name, 'normality': normality, 'variance': variance}
+    df.attrs['stat_assumptions'] = assumptions
+    return assumptions
+
 class SpotifyDataCleaner:
     """Clean and validate Spotify data for analysis"""
     
-    def __init__(self, df: pd.DataFrame):
-        """Initialize with raw data"""
-        self.df = df.copy()
+    def __init__(self, df: pd.DataFrame, cache_dir: Optional[str] = "data/.cache"):
+        """
+        Initialize with raw data
+        Args:
+            df: Raw DataFrame to clean
+            cache_dir: Directory for cached cleaned frames, keyed by input content; None disables caching
+        """
+        # Not copied: cleaning only reads the raw frame and builds cleaned_df as a new frame
+        self.df = df
         self.cleaned_df = None
         self.validation_results = {}
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        # Column names of the frame being cleaned, refreshed when a stage adds columns
+        self._cols = frozenset(self.df.columns)
     
     def clean_data(self) -> pd.DataFrame:
         """
@@ -33,181 +160,249 @@ class SpotifyDataCleaner:
         """
         logger.info("🧹 Starting data cleaning...")
         
-        print("\n🧹 STEP 2: DATA CLEANING")
-        print("=" * 50)
-        
-        # 2.1: Handle missing values
-        self._handle_missing_values()
-        
-        # 2.2: Remove duplicates
-        self._remove_duplicates()
-        
-        # 2.3: Validate data types
-        self._validate_data_types()
-        
-        # 2.4: Handle outliers
-        self._handle_outliers()
+        cache_path = self._cache_path()
+        if cache_path is not None and cache_path.exists():
+            # Same input as a previous run; the cleaned frame is memory-mapped from disk
+            logger.info("📦 Using cached cleaned data %s", cache_path.name)
+            self.cleaned_df = pq.read_table(cache_path, memory_map=True).to_pandas()
+            self._cols = frozenset(self.cleaned_df.columns)
+            self._validate_cleaned_data()
+            return self.cleaned_df
+        
+        if POLARS_AVAILABLE:
+            # 2.1-2.4 as one lazy Polars query
+            self._clean_rows_lazily()
+        else:
+            # 2.1: Handle missing values
+            self._handle_missing_values()
+            
+            # 2.2: Remove duplicates (applies the 2.1 row drops in the same slice)
+            self._remove_duplicates()
+            self._fill_missing_features()
+            
+            # 2.3: Validate data types
+            self._validate_data_types()
+            
+            # 2.4: Handle outliers
+            self._handle_outliers()
         
         # 2.5: Create derived features
         self._create_derived_features()
+        self._cols = frozenset(self.cleaned_df.columns)
         
         # 2.6: Validate cleaned data
         self._validate_cleaned_data()
         
+        if cache_path is not None:
+            self._write_cache(cache_path)
+        
         logger.info("✅ Data cleaning completed")
         
         return self.cleaned_df
     
+    def _cache_path(self) -> Optional[Path]:
+        """Cache file for the cleaned version of this input, keyed by the cleaning rules and a hash of its contents"""
+        if self.cache_dir is None:
+            return None
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(_CLEANING_RULES.encode('utf-8'))
+        digest.update('\x1f'.join(map(str, self.df.columns)).encode('utf-8'))
+        digest.update('\x1f'.join(map(str, self.df.dtypes)).encode('utf-8'))
+        digest.update(pd.util.hash_pandas_object(self.df, index=False).to_numpy().tobytes())
+        return self.cache_dir / f"cleaned_{digest.hexdigest()}.parquet"
+    
+    def _write_cache(self, cache_path: Path):
+        """Save the cleaned frame so the next run on the same input can skip cleaning"""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write to a temp file first so a concurrent run never reads a partial table
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            pq.write_table(pa.Table.from_pandas(self.cleaned_df, preserve_index=False),
+                           tmp_path, compression='zstd')
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Could not write cleaned data cache: {e}")
+    
+    def _clean_rows_lazily(self):
+        """Run missing-value, duplicate, type and outlier handling as one Polars LazyFrame plan"""
+        columns = self._cols
+        lf = pl.from_pandas(self.df).lazy()
+        
+        # 2.1: Missing values
+        non_empty = lf.filter(~pl.all_horizontal(pl.all().is_null()))
+        fills = [pl.col(col).fill_null(0) for col in ['title_length', 'word_count'] if col in columns]
+        fills += [pl.col(col).fill_null(False) for col in BOOL_COLUMNS if col in columns]
+        keyed = non_empty.drop_nulls([col for col in KEY_COLUMNS if col in columns]).with_columns(fills)
+        
+        # 2.2: Duplicates (first occurrence wins, original order kept)
+        deduped = keyed.unique(subset=['track_name', 'artist_name'], keep='first', maintain_order=True)
+        
+        # 2.3: Types - only non-numeric / non-boolean columns need converting
+        schema = deduped.collect_schema()
+        casts = [pl.col(col).cast(pl.Float64, strict=False)
+                 for col in NUMERIC_COLUMNS if col in columns and not schema[col].is_numeric()]
+        casts += [pl.col(col).cast(pl.Boolean) if schema[col].is_numeric() else pl.col(col).str.to_lowercase() == 'true'
+                  for col in BOOL_COLUMNS if col in columns and schema[col] != pl.Boolean]
+        typed = deduped.with_columns(casts)
+        
+        # 2.4: Outliers
+        ranges = {col: bounds for col, bounds in VALID_RANGES.items() if col in columns}
+        cleaned = typed.with_columns([pl.col(col).clip(lo, hi) for col, (lo, hi) in ranges.items()])
+        
+        # Counts for the report come from the same plan; collect_all shares the common scans
+        stats_query = pl.concat([
+            non_empty.select(pl.len().alias('n'), pl.lit('non_empty').alias('stage')),
+            keyed.select(pl.len().alias('n'), pl.lit('keyed').alias('stage')),
+            deduped.select(pl.len().alias('n'), pl.lit('deduped').alias('stage'))
+        ])
+        queries = [stats_query, cleaned]
+        # Per-column missing and outlier counts are only needed for the debug report
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            queries.append(non_empty.select(pl.all().null_count()))
+            queries.append(typed.select([((pl.col(col) < lo) | (pl.col(col) > hi)).sum().alias(col)
+                                         for col, (lo, hi) in ranges.items()]))
+        stage_counts, result, *details = pl.collect_all(queries)
+        counts = dict(zip(stage_counts['stage'], stage_counts['n']))
+        
+        empty_rows_removed = len(self.df) - counts['non_empty']
+        if empty_rows_removed > 0:
+            logger.info("Removed %d completely empty rows", empty_rows_removed)
+        key_rows_removed = counts['non_empty'] - counts['keyed']
+        if key_rows_removed > 0:
+            logger.info("Removed %d rows with missing key values", key_rows_removed)
+        logger.info("Removed %d duplicate entries", counts['keyed'] - counts['deduped'])
+        
+        if debug:
+            missing, outliers = details
+            logger.debug("Missing values: %s",
+                         {col: count for col, count in missing.row(0, named=True).items() if count > 0})
+            logger.debug("Clipped outliers: %s", outliers.row(0, named=True))
+        
+        # Polars returns plain NumPy dtypes and categoricals in row-appearance order; give the
+        # columns it did not convert their input dtypes back, as the pandas path keeps them
+        converted = {col for col in NUMERIC_COLUMNS if col in columns and not schema[col].is_numeric()}
+        converted |= {col for col in BOOL_COLUMNS if col in columns and schema[col] != pl.Boolean}
+        cleaned_df = result.to_pandas()
+        restore = {}
+        for col, dtype in self.df.dtypes.items():
+            # Mixed object numeric / flag columns get their type from step 2.3, as in the pandas path
+            if col in converted or (dtype == object and col in TYPED_COLUMNS):
+                continue
+            if isinstance(dtype, pd.CategoricalDtype):
+                # An unordered astype treats any category order as equal, so set them explicitly
+                restore[col] = cleaned_df[col].cat.set_categories(dtype.categories, ordered=dtype.ordered)
+            elif cleaned_df[col].dtype != dtype:
+                restore[col] = cleaned_df[col].astype(dtype)
+        self.cleaned_df = cleaned_df.assign(**restore) if restore else cleaned_df
+    
     def _handle_missing_values(self):
         """Handle missing values in the dataset"""
-        print("\n🔍 HANDLING MISSING VALUES")
-        print("-" * 40)
-        
-        # Remove completely empty rows first
-        initial_count = len(self.df)
-        self.cleaned_df = self.df.dropna(how='all')
-        empty_rows_removed = initial_count - len(self.cleaned_df)
+        # Rows are only marked here; _remove_duplicates applies every drop in a single slice
+        na = self.df.isna()
+        empty = na.all(axis=1).to_numpy()
+        empty_rows_removed = int(empty.sum())
         if empty_rows_removed > 0:
-            print(f"Removed {empty_rows_removed:,} completely empty rows")
+            logger.info("Removed %d completely empty rows", empty_rows_removed)
         
-        # Check for missing values
-        missing = self.cleaned_df.isnull().sum()
-        if missing.any():
-            print("Missing values found:")
-            for col, count in missing[missing > 0].items():
-                print(f"  • {col}: {count:,}")
-        else:
-            print("✅ No missing values found")
+        # Report missing values (every empty row is missing in every column)
+        if logger.isEnabledFor(logging.DEBUG):
+            missing = na.sum() - empty_rows_removed
+            logger.debug("Missing values: %s", missing[missing > 0].to_dict())
         
         # Drop rows with missing key values
-        key_cols = ['track_name', 'artist_name', 'popularity', 'duration_ms', 'genre_category']
-        before_key_drop = len(self.cleaned_df)
-        self.cleaned_df = self.cleaned_df.dropna(subset=key_cols)
-        key_rows_removed = before_key_drop - len(self.cleaned_df)
+        key_ok = ~na[KEY_COLUMNS].any(axis=1).to_numpy()
+        key_rows_removed = int((~key_ok & ~empty).sum())
         if key_rows_removed > 0:
-            print(f"Removed {key_rows_removed:,} rows with missing key values")
+            logger.info("Removed %d rows with missing key values", key_rows_removed)
         
-        # Fill missing values in derived features
-        if 'title_length' in self.cleaned_df.columns:
-            self.cleaned_df['title_length'] = self.cleaned_df['title_length'].fillna(0)
-        if 'word_count' in self.cleaned_df.columns:
-            self.cleaned_df['word_count'] = self.cleaned_df['word_count'].fillna(0)
-        if 'has_numbers' in self.cleaned_df.columns:
-            self.cleaned_df['has_numbers'] = self.cleaned_df['has_numbers'].fillna(False)
-        if 'has_special_chars' in self.cleaned_df.columns:
-            self.cleaned_df['has_special_chars'] = self.cleaned_df['has_special_chars'].fillna(False)
+        self._keep_mask = key_ok
     
     def _remove_duplicates(self):
         """Remove duplicate entries"""
-        print("\n🔍 REMOVING DUPLICATES")
-        print("-" * 40)
+        # Duplicates are judged among the rows that survived the missing-value checks
+        keep = self._keep_mask.copy()
+        duplicated = self.df.loc[keep, ['track_name', 'artist_name']].duplicated().to_numpy()
+        keep[np.flatnonzero(keep)] = ~duplicated
+        self.cleaned_df = self.df.loc[keep].reset_index(drop=True)
         
-        initial_count = len(self.cleaned_df)
-        self.cleaned_df = self.cleaned_df.drop_duplicates(subset=['track_name', 'artist_name'])
-        removed_count = initial_count - len(self.cleaned_df)
-        
-        print(f"Removed {removed_count:,} duplicate entries")
+        logger.info("Removed %d duplicate entries", duplicated.sum())
+    
+    def _fill_missing_features(self):
+        """Fill missing values in derived features"""
+        if 'title_length' in self._cols:
+            self.cleaned_df['title_length'] = self.cleaned_df['title_length'].fillna(0)
+        if 'word_count' in self._cols:
+            self.cleaned_df['word_count'] = self.cleaned_df['word_count'].fillna(0)
+        if 'has_numbers' in self._cols:
+            self.cleaned_df['has_numbers'] = self.cleaned_df['has_numbers'].fillna(False)
+        if 'has_special_chars' in self._cols:
+            self.cleaned_df['has_special_chars'] = self.cleaned_df['has_special_chars'].fillna(False)
     
     def _validate_data_types(self):
         """Validate and convert data types"""
-        print("\n🔍 VALIDATING DATA TYPES")
-        print("-" * 40)
-        
-        # Convert numeric columns
-        numeric_cols = ['popularity', 'duration_ms', 'title_length', 'word_count']
-        for col in numeric_cols:
-            if col in self.cleaned_df.columns:
+        # Convert numeric columns (already-numeric columns, e.g. from typed loads, are left as is)
+        for col in NUMERIC_COLUMNS:
+            if col in self._cols and not pd.api.types.is_numeric_dtype(self.cleaned_df[col]):
                 self.cleaned_df[col] = pd.to_numeric(self.cleaned_df[col], errors='coerce')
         
         # Convert boolean columns
-        bool_cols = ['has_numbers', 'has_special_chars']
-        for col in bool_cols:
-            if col in self.cleaned_df.columns:
+        for col in BOOL_COLUMNS:
+            if col in self._cols and not pd.api.types.is_bool_dtype(self.cleaned_df[col]):
                 self.cleaned_df[col] = self.cleaned_df[col].astype(bool)
     
     def _handle_outliers(self):
         """Handle outliers in numeric columns"""
-        print("\n🔍 HANDLING OUTLIERS")
-        print("-" * 40)
-        
-        # Define valid ranges
-        ranges = {
-            'popularity': (0, 100),
-            'duration_ms': (0, 3600000),  # 1 hour max
-            'title_length': (0, 200),     # 200 characters max
-            'word_count': (0, 50)         # 50 words max
-        }
-        
-        # Clip values to valid ranges
-        for col, (min_val, max_val) in ranges.items():
-            if col in self.cleaned_df.columns:
-                initial_outliers = len(self.cleaned_df[
-                    (self.cleaned_df[col] < min_val) | 
-                    (self.cleaned_df[col] > max_val)
-                ])
-                
-                self.cleaned_df[col] = self.cleaned_df[col].clip(min_val, max_val)
-                
-                print(f"{col}: Clipped {initial_outliers:,} outliers to range [{min_val}, {max_val}]")
+        cols = [col for col in VALID_RANGES if col in self._cols]
+        if not cols:
+            return
+        lower = pd.Series({col: VALID_RANGES[col][0] for col in cols})
+        upper = pd.Series({col: VALID_RANGES[col][1] for col in cols})
+        
+        # Clip every column in one call; clipped values are counted only for the debug report
+        original = self.cleaned_df[cols]
+        clipped = original.clip(lower=lower, upper=upper, axis=1)
+        if logger.isEnabledFor(logging.DEBUG):
+            outliers = (original.ne(clipped) & original.notna()).sum()
+            logger.debug("Clipped outliers: %s", outliers.to_dict())
+        self.cleaned_df[cols] = clipped
     
     def _create_derived_features(self):
         """Create derived features for analysis"""
-        print("\n🔍 CREATING DERIVED FEATURES")
-        print("-" * 40)
-        
         # Title length groups
         self.cleaned_df['title_length_group'] = pd.cut(
-            self.cleaned_df['title_length'],
-            bins=[0, 20, 40, 60, float('inf')],
-            labels=['Very Short (0-20)', 'Short (21-40)', 'Medium (41-60)', 'Long (60+)']
+            self.cleaned_df['title_length'], bins=TITLE_LENGTH_BINS, labels=TITLE_LENGTH_LABELS
         )
         
         # Word count groups
         self.cleaned_df['word_count_group'] = pd.cut(
-            self.cleaned_df['word_count'],
-            bins=[0, 2, 4, float('inf')],
-            labels=['Short (1-2 words)', 'Medium (3-4 words)', 'Long (5+ words)']
+            self.cleaned_df['word_count'], bins=WORD_COUNT_BINS, labels=WORD_COUNT_LABELS
         )
         
         # Popularity categories
         self.cleaned_df['popularity_category'] = pd.cut(
-            self.cleaned_df['popularity'],
-            bins=[0, 20, 40, 60, 80, 100],
-            labels=['Very Low (0-20)', 'Low (21-40)', 'Medium (41-60)', 'High (61-80)', 'Very High (81-100)']
+            self.cleaned_df['popularity'], bins=POPULARITY_BINS, labels=POPULARITY_LABELS
         )
         
-        # Title feature combinations
-        self.cleaned_df['title_feature_group'] = self.cleaned_df.apply(
-            lambda x: f"{'Has Numbers' if x['has_numbers'] else 'No Numbers'}, "
-                     f"{'Has Special Chars' if x['has_special_chars'] else 'No Special Chars'}",
-            axis=1
-        )
+        # Title feature combinations, built from the two flags as integer codes
+        codes = (self.cleaned_df['has_numbers'].to_numpy(dtype=np.uint8) * 2 +
+                 self.cleaned_df['has_special_chars'].to_numpy(dtype=np.uint8))
+        self.cleaned_df['title_feature_group'] = pd.Categorical.from_codes(
+            codes, categories=TITLE_FEATURE_GROUPS
+        ).remove_unused_categories()
     
     def _validate_cleaned_data(self):
         """Validate cleaned data"""
-        print("\n🔍 VALIDATING CLEANED DATA")
-        print("-" * 40)
-        
         # Check for remaining missing values
         missing = self.cleaned_df.isnull().sum()
         if missing.any():
-            print("⚠️  Warning: Missing values remain:")
-            for col, count in missing[missing > 0].items():
-                print(f"  • {col}: {count:,}")
-        else:
-            print("✅ No missing values in cleaned data")
+            logger.warning("⚠️  Missing values remain: %s", missing[missing > 0].to_dict())
         
-        # Check data types
-        print("\nData types:")
-        for col, dtype in self.cleaned_df.dtypes.items():
-            print(f"  • {col}: {dtype}")
-        
-        # Check value ranges
-        print("\nValue ranges:")
-        numeric_cols = ['popularity', 'duration_ms', 'title_length', 'word_count']
-        for col in numeric_cols:
-            if col in self.cleaned_df.columns:
-                print(f"  • {col}: [{self.cleaned_df[col].min():.1f}, {self.cleaned_df[col].max():.1f}]")
+        # Data types and value ranges are only reported when debugging
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Data types: %s", self.cleaned_df.dtypes.astype(str).to_dict())
+            numeric_cols = [col for col in NUMERIC_COLUMNS if col in self._cols]
+            logger.debug("Value ranges: %s", self.cleaned_df[numeric_cols].agg(['min', 'max']).to_dict())
         
         # Store validation results
         self.validation_results = {
@@ -227,28 +422,18 @@ class SpotifyDataCleaner:
         # 1. Normality tests
         print("1. Testing for normality:")
         
-        # Shapiro-Wilk test for smaller samples, Anderson-Darling for larger
-        sample_size = min(5000, len(self.cleaned_df))
-        if sample_size < 5000:
-            title_stat, title_p = stats.shapiro(self.cleaned_df['title_length'].sample(sample_size))
-            word_stat, word_p = stats.shapiro(self.cleaned_df['word_count'].sample(sample_size))
-            pop_stat, pop_p = stats.shapiro(self.cleaned_df['popularity'].sample(sample_size))
-            test_name = "Shapiro-Wilk"
-        else:
-            title_stat, title_p = stats.normaltest(self.cleaned_df['title_length'])
-            word_stat, word_p = stats.normaltest(self.cleaned_df['word_count'])
-            pop_stat, pop_p = stats.normaltest(self.cleaned_df['popularity'])
-            test_name = "D'Agostino-Pearson"
+        shared = _compute_assumptions(self.cleaned_df)
+        normality = shared['normality']
+        test_name = shared['test_used']
         
         print(f"   {test_name} test results:")
-        print(f"   Title Length: statistic={title_stat:.4f}, p-value={title_p:.4f}")
-        print(f"   Word Count: statistic={word_stat:.4f}, p-value={word_p:.4f}")
-        print(f"   Popularity: statistic={pop_stat:.4f}, p-value={pop_p:.4f}")
+        for col, label in [('title_length', 'Title Length'), ('word_count', 'Word Count'), ('popularity', 'Popularity')]:
+            print(f"   {label}: statistic={normality[col]['statistic']:.4f}, p-value={normality[col]['p_value']:.4f}")
         
         assumptions['normality'] = {
-            'title_length_normal': title_p > 0.05,
-            'word_count_normal': word_p > 0.05,
-            'popularity_normal': pop_p > 0.05,
+            'title_length_normal': normality['title_length']['p_value'] > 0.05,
+            'word_count_normal': normality['word_count']['p_value'] > 0.05,
+            'popularity_normal': normality['popularity']['p_value'] > 0.05,
             'test_used': test_name
         }
         
@@ -256,31 +441,29 @@ class SpotifyDataCleaner:
         print("\n2. Testing for equal variances across groups:")
         
         # Test word count groups
-        if 'word_count_group' in self.cleaned_df.columns:
-            groups = [group['popularity'].values for name, group in self.cleaned_df.groupby('word_count_group')]
-            levene_stat, levene_p = stats.levene(*groups)
-            print(f"   Word Count Groups - Levene's test: statistic={levene_stat:.4f}, p-value={levene_p:.4f}")
-            assumptions['word_count_equal_variance'] = levene_p > 0.05
+        if 'word_count_group' in shared['variance']:
+            levene = shared['variance']['word_count_group']
+            print(f"   Word Count Groups - Levene's test: statistic={levene['statistic']:.4f}, p-value={levene['p_value']:.4f}")
+            assumptions['word_count_equal_variance'] = levene['p_value'] > 0.05
         
         # Test title feature groups
-        if 'title_feature_group' in self.cleaned_df.columns:
-            groups = [group['popularity'].values for name, group in self.cleaned_df.groupby('title_feature_group')]
-            levene_stat, levene_p = stats.levene(*groups)
-            print(f"   Title Feature Groups - Levene's test: statistic={levene_stat:.4f}, p-value={levene_p:.4f}")
-            assumptions['title_feature_equal_variance'] = levene_p > 0.05
+        if 'title_feature_group' in shared['variance']:
+            levene = shared['variance']['title_feature_group']
+            print(f"   Title Feature Groups - Levene's test: statistic={levene['statistic']:.4f}, p-value={levene['p_value']:.4f}")
+            assumptions['title_feature_equal_variance'] = levene['p_value'] > 0.05
         
         # 3. Sample size adequacy
         print("\n3. Sample size adequacy:")
         total_n = len(self.cleaned_df)
         print(f"   Total sample size: {total_n:,}")
         
-        if 'word_count_group' in self.cleaned_df.columns:
+        if 'word_count_group' in self._cols:
             group_sizes = self.cleaned_df['word_count_group'].value_counts()
             min_group_size = group_sizes.min()
             print(f"   Minimum word count group size: {min_group_size:,}")
             assumptions['word_count_adequate_sample'] = min_group_size >= 30
         
-        if 'title_feature_group' in self.cleaned_df.columns:
+        if 'title_feature_group' in self._cols:
             group_sizes = self.cleaned_df['title_feature_group'].value_counts()
             min_group_size = group_sizes.min()
             print(f"   Minimum title feature group size: {min_group_size:,}")
@@ -312,7 +495,7 @@ def run_data_cleaning():
     print("=" * 50)
     
     # Load data
-    from .data_loader import SpotifyDataLoader
+    from .data_loader import SpotifyDataLoader, save_parquet
     loader = SpotifyDataLoader()
     df = loader.load_data("spotify_tracks.csv")
     
@@ -320,10 +503,12 @@ def run_data_cleaning():
     cleaner = SpotifyDataCleaner(df)
     cleaned_df = cleaner.clean_data()
     
+    # Run the assumption tests once here; the results travel with the saved frame to the EDA step
+    cleaner._check_statistical_assumptions()
+    
     # Save cleaned data
     timestamp = pd.Timestamp.now().strftime("%Y%m%d_%H%M%S")
-    output_file = f"data/spotify_cleaned_data_{timestamp}.csv"
-    cleaned_df.to_csv(output_file, index=False)
+    output_file = save_parquet(cleaned_df, f"data/spotify_cleaned_data_{timestamp}.parquet")
     print(f"\n✅ Cleaned data saved to {output_file}")
     
     return cleaned_df
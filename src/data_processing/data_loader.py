@@ -13,8 +13,61 @@ from pathlib import Path
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Repeated string columns held as categoricals (dictionary-encoded in Parquet)
+CATEGORY_COLUMNS = ['genre_category', 'artist_name']
+BOOL_COLUMNS = ['has_numbers', 'has_special_chars']
+
+# Smallest dtypes that hold each column's valid range; nullable so missing values survive the read
+CSV_DTYPES = {
+    'popularity': 'Int8',
+    'title_length': 'Int16',
+    'word_count': 'Int16',
+    'release_year': 'Int16',
+    'duration_ms': 'Int32',
+    **{col: 'boolean' for col in BOOL_COLUMNS},
+    **{col: 'category' for col in CATEGORY_COLUMNS}
+}
+
+# DataFrame.attrs entries that are in-memory caches and are not written to Parquet
+SESSION_ATTRS = frozenset({'stat_assumptions'})
+
+def save_parquet(df: pd.DataFrame, path) -> Path:
+    """
+    Save a Zstandard-compressed Parquet copy of a dataset
+    Args:
+        df: DataFrame to save
+        path: Destination path; the suffix is replaced with .parquet
+    Returns:
+        Path of the written Parquet file
+    """
+    parquet_path = Path(path).with_suffix('.parquet')
+    dtypes = {col: 'category' for col in CATEGORY_COLUMNS if col in df.columns}
+    # Flags with missing values use the nullable dtype; astype(bool) would fail on NA
+    dtypes.update({col: 'boolean' if df[col].hasnans else bool
+                   for col in BOOL_COLUMNS if col in df.columns})
+    out = df.astype(dtypes)
+    # Cached test results describe this session's frame, not the saved file
+    out.attrs = {key: value for key, value in df.attrs.items() if key not in SESSION_ATTRS}
+    out.to_parquet(parquet_path, engine='pyarrow', compression='zstd', index=False)
+    return parquet_path
+
+def save_csv(df: pd.DataFrame, path) -> None:
+    """
+    Save a dataset as CSV using PyArrow's multithreaded writer
+    Args:
+        df: DataFrame to save
+        path: Destination CSV path
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+    except ImportError:
+        df.to_csv(path, index=False)
+        return
+    pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), str(path))
+
 class SpotifyDataLoader:
-    """Load and validate Spotify data from CSV files"""
+    """Load and validate Spotify data from CSV or Parquet files"""
     
     def __init__(self, data_dir: str = "data"):
         """Initialize data loader with data directory"""
@@ -24,9 +77,10 @@ class SpotifyDataLoader:
     
     def load_data(self, filename: str) -> pd.DataFrame:
         """
-        Load data from CSV file
+        Load data from CSV or Parquet file
+        A CSV request is served from its Parquet copy when one at least as new exists
         Args:
-            filename: Name of CSV file in data directory
+            filename: Name of CSV or Parquet file in data directory
         Returns:
             Loaded DataFrame
         """
@@ -37,13 +91,34 @@ class SpotifyDataLoader:
             raise FileNotFoundError(f"Data file not found: {file_path}")
         
         try:
-            self.df = pd.read_csv(file_path)
+            parquet_path = file_path.with_suffix('.parquet')
+            if (file_path.suffix != '.parquet' and parquet_path.exists()
+                    and parquet_path.stat().st_mtime >= file_path.stat().st_mtime):
+                logger.info(f"📦 Using Parquet copy {parquet_path.name}")
+                file_path = parquet_path
+            
+            if file_path.suffix == '.parquet':
+                self.df = pd.read_parquet(file_path, memory_map=True)
+            else:
+                self.df = self._read_csv(file_path)
             logger.info(f"✅ Successfully loaded {len(self.df)} rows")
             return self.df
         except Exception as e:
             logger.error(f"❌ Error loading data: {str(e)}")
             raise
     
+    @staticmethod
+    def _read_csv(file_path: Path) -> pd.DataFrame:
+        """
+        Read a CSV straight into compact dtypes
+        Falls back to inferred dtypes if a column holds values outside its compact type
+        """
+        try:
+            return pd.read_csv(file_path, engine='pyarrow', dtype=CSV_DTYPES)
+        except (ValueError, TypeError) as e:
+            logger.warning(f"⚠️ Compact dtypes did not fit {file_path.name} ({e}); using inferred dtypes")
+            return pd.read_csv(file_path)
+    
     def get_summary(self) -> Dict:
         """
         Get summary statistics for loaded data
@@ -11,9 +11,67 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 from scipy import stats
 import logging
-from typing import Dict, List, Optional, Tuple
+import os
+from itertools import combinations
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
 from pathlib import Path
 
+from .data_cleaner import (
+    _compute_assumptions, TITLE_LENGTH_BINS, TITLE_LENGTH_LABELS, TITLE_LENGTH_DTYPE,
+    WORD_COUNT_BINS, WORD_COUNT_LABELS, WORD_COUNT_DTYPE
+)
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+def _pairwise_cohens_d_numpy(values: np.ndarray, codes: np.ndarray, n_groups: int):
+    """
+    Per-group sizes and Cohen's d for every pair of groups.
+    d[i, j] compares group i against group j (d[j, i] == -d[i, j]); codes of -1 are ignored.
+    """
+    valid = codes >= 0
+    codes, values = codes[valid], values[valid]
+    counts = np.bincount(codes, minlength=n_groups).astype(np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        means = np.bincount(codes, weights=values, minlength=n_groups) / counts
+        variances = (np.bincount(codes, weights=values * values, minlength=n_groups)
+                     - counts * means * means) / (counts - 1)
+        d = (means[:, None] - means[None, :]) / np.sqrt((variances[:, None] + variances[None, :]) / 2)
+    np.fill_diagonal(d, np.nan)
+    return counts, d
+
+def _pairwise_cohens_d_kernel(values: np.ndarray, codes: np.ndarray, n_groups: int):
+    """Single-pass loop version of _pairwise_cohens_d_numpy, compiled with numba."""
+    counts = np.zeros(n_groups)
+    sums = np.zeros(n_groups)
+    sumsq = np.zeros(n_groups)
+    for k in range(values.shape[0]):
+        g = codes[k]
+        if g < 0:
+            continue
+        counts[g] += 1
+        sums[g] += values[k]
+        sumsq[g] += values[k] * values[k]
+    
+    means = sums / counts
+    variances = (sumsq - counts * means * means) / (counts - 1)
+    
+    d = np.full((n_groups, n_groups), np.nan)
+    for i in range(n_groups):
+        for j in range(i + 1, n_groups):
+            d[i, j] = (means[i] - means[j]) / np.sqrt((variances[i] + variances[j]) / 2)
+            d[j, i] = -d[i, j]
+    return counts, d
+
+if NUMBA_AVAILABLE:
+    _pairwise_cohens_d = njit(cache=True, error_model='numpy')(_pairwise_cohens_d_kernel)
+else:
+    _pairwise_cohens_d = _pairwise_cohens_d_numpy
+
 class SpotifyEDA:
     """Performs exploratory data analysis on Spotify track data."""
     
@@ -21,20 +79,39 @@ class SpotifyEDA:
         self.df = df
         self.title_features = ['title_length', 'word_count', 'has_numbers', 'has_special_chars']
         
+        # Group columns from the cleaner are reused; raw or CSV-loaded data is binned here
+        self._ensure_group_column('title_length_group', 'title_length',
+                                  TITLE_LENGTH_BINS, TITLE_LENGTH_LABELS, TITLE_LENGTH_DTYPE)
+        self._ensure_group_column('word_count_group', 'word_count',
+                                  WORD_COUNT_BINS, WORD_COUNT_LABELS, WORD_COUNT_DTYPE)
+        
+    def _ensure_group_column(self, group_col: str, source_col: str, bins: np.ndarray,
+                             labels: List[str], dtype: pd.CategoricalDtype):
+        """Bin a column into its group column unless it already holds the shared categories."""
+        if group_col in self.df.columns and self.df[group_col].dtype == dtype:
+            return
+        self.df[group_col] = pd.cut(self.df[source_col], bins=bins, labels=labels)
+    
     def full_eda_report(self) -> Dict:
         """Generate a comprehensive EDA report."""
         logging.info("Starting exploratory data analysis...")
         
-        results = {
-            'dataset_overview': self._analyse_dataset_overview(),
-            'distributions': self._analyse_distributions(),
-            'correlations': self._analyse_correlations(),
-            'title_length_analysis': self._analyse_title_length(),
-            'word_count_analysis': self._analyse_word_count(),
-            'title_features_analysis': self._analyse_title_features(),
-            'statistical_assumptions': self._check_statistical_assumptions()
+        analyses = {
+            'dataset_overview': self._analyse_dataset_overview,
+            'distributions': self._analyse_distributions,
+            'correlations': self._analyse_correlations,
+            'title_length_analysis': self._analyse_title_length,
+            'word_count_analysis': self._analyse_word_count,
+            'title_features_analysis': self._analyse_title_features,
+            'statistical_assumptions': self._check_statistical_assumptions
         }
         
+        # The analyses only read self.df (group columns are binned in __init__), so they can
+        # overlap; numpy and scipy release the GIL for the heavy work
+        with ThreadPoolExecutor(max_workers=min(len(analyses), os.cpu_count() or 1)) as pool:
+            futures = {name: pool.submit(analysis) for name, analysis in analyses.items()}
+            results = {name: future.result() for name, future in futures.items()}
+        
         logging.info("Exploratory analysis complete")
         return results
     
@@ -85,48 +162,32 @@ class SpotifyEDA:
     
     def _analyse_correlations(self) -> Dict:
         """Analyse correlations between variables."""
-        # Calculate correlations
-        corr_matrix = self.df[['popularity', 'title_length', 'word_count']].corr()
+        # One correlation matrix over the numeric columns and the 0/1 flags;
+        # point-biserial correlation is Pearson's r against a binary variable
+        numeric_cols = ['popularity', 'title_length', 'word_count']
+        flag_cols = ['has_numbers', 'has_special_chars']
+        values = np.column_stack([self.df[col].to_numpy(dtype=np.float64) for col in numeric_cols + flag_cols])
+        values = values[~np.isnan(values).any(axis=1)]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            corr = np.corrcoef(values, rowvar=False)
         
-        # Calculate point-biserial correlations for binary features
-        pb_corr_numbers = stats.pointbiserialr(self.df['has_numbers'], self.df['popularity'])
-        pb_corr_special = stats.pointbiserialr(self.df['has_special_chars'], self.df['popularity'])
+        corr_matrix = pd.DataFrame(corr[:3, :3], index=numeric_cols, columns=numeric_cols)
         
         return {
             'correlation_matrix': corr_matrix.to_dict(),
             'point_biserial_correlations': {
-                'has_numbers': pb_corr_numbers.correlation,
-                'has_special_chars': pb_corr_special.correlation
+                'has_numbers': corr[0, 3],
+                'has_special_chars': corr[0, 4]
             }
         }
     
     def _analyse_title_length(self) -> Dict:
         """Analyse title length patterns."""
-        # Create title length groups
-        self.df['title_length_group'] = pd.cut(
-            self.df['title_length'],
-            bins=[0, 20, 40, 60, float('inf')],
-            labels=['Very Short', 'Short', 'Medium', 'Long']
-        )
-        
         # Calculate group statistics
-        group_stats = self.df.groupby('title_length_group')['popularity'].agg([
-            'count', 'mean', 'std', 'median'
-        ]).to_dict()
+        group_stats = self._group_popularity_stats('title_length_group')
         
         # Calculate effect sizes
-        groups = self.df.groupby('title_length_group')['popularity']
-        effect_sizes = {}
-        
-        for g1 in self.df['title_length_group'].unique():
-            for g2 in self.df['title_length_group'].unique():
-                if g1 < g2:
-                    g1_data = groups.get_group(g1)
-                    g2_data = groups.get_group(g2)
-                    cohens_d = (g1_data.mean() - g2_data.mean()) / np.sqrt(
-                        (g1_data.var() + g2_data.var()) / 2
-                    )
-                    effect_sizes[f"{g1}_vs_{g2}"] = cohens_d
+        effect_sizes = self._pairwise_effect_sizes('title_length_group')
         
         return {
             'group_statistics': group_stats,
@@ -136,31 +197,11 @@ class SpotifyEDA:
     
     def _analyse_word_count(self) -> Dict:
         """Analyse word count patterns."""
-        # Create word count groups
-        self.df['word_count_group'] = pd.cut(
-            self.df['word_count'],
-            bins=[0, 2, 4, float('inf')],
-            labels=['Short', 'Medium', 'Long']
-        )
-        
         # Calculate group statistics
-        group_stats = self.df.groupby('word_count_group')['popularity'].agg([
-            'count', 'mean', 'std', 'median'
-        ]).to_dict()
+        group_stats = self._group_popularity_stats('word_count_group')
         
         # Calculate effect sizes
-        groups = self.df.groupby('word_count_group')['popularity']
-        effect_sizes = {}
-        
-        for g1 in self.df['word_count_group'].unique():
-            for g2 in self.df['word_count_group'].unique():
-                if g1 < g2:
-                    g1_data = groups.get_group(g1)
-                    g2_data = groups.get_group(g2)
-                    cohens_d = (g1_data.mean() - g2_data.mean()) / np.sqrt(
-                        (g1_data.var() + g2_data.var()) / 2
-                    )
-                    effect_sizes[f"{g1}_vs_{g2}"] = cohens_d
+        effect_sizes = self._pairwise_effect_sizes('word_count_group')
         
         return {
             'group_statistics': group_stats,
@@ -168,32 +209,75 @@ class SpotifyEDA:
             'correlation_with_popularity': self.df['word_count'].corr(self.df['popularity'])
         }
     
+    def _group_popularity_stats(self, group_col: str) -> Dict:
+        """Count, mean, std and median of popularity per observed group, keyed like groupby().agg().to_dict()."""
+        codes, uniques = pd.factorize(self.df[group_col], sort=True)
+        labels = uniques.tolist()
+        if not labels:
+            return {'count': {}, 'mean': {}, 'std': {}, 'median': {}}
+        
+        # Sort once by group code so every group is a contiguous slice; missing groups (-1) are dropped
+        values = self.df['popularity'].to_numpy(dtype=np.float64)
+        valid = codes >= 0
+        order = np.argsort(codes[valid], kind='stable')
+        codes, values = codes[valid][order], values[valid][order]
+        starts = np.searchsorted(codes, np.arange(len(labels)))
+        counts = np.diff(np.append(starts, len(codes)))
+        
+        means = np.add.reduceat(values, starts) / counts
+        deviations = values - np.repeat(means, counts)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            stds = np.sqrt(np.add.reduceat(deviations * deviations, starts) / (counts - 1))
+        medians = [float(np.median(group)) for group in np.split(values, starts[1:])]
+        
+        return {
+            'count': dict(zip(labels, counts.tolist())),
+            'mean': dict(zip(labels, means.tolist())),
+            'std': dict(zip(labels, stds.tolist())),
+            'median': dict(zip(labels, medians))
+        }
+    
+    def _pairwise_effect_sizes(self, group_col: str) -> Dict:
+        """Cohen's d of popularity between every pair of observed groups (labels compared as strings)."""
+        groups = self.df[group_col].cat
+        counts, d = _pairwise_cohens_d(
+            self.df['popularity'].to_numpy(dtype=np.float64),
+            groups.codes.to_numpy(),
+            len(groups.categories)
+        )
+        
+        labels = groups.categories
+        observed = np.flatnonzero(counts > 0)
+        effect_sizes = {}
+        for i, j in combinations(observed, 2):
+            # Keys name the lexically smaller label first
+            if labels[j] < labels[i]:
+                i, j = j, i
+            effect_sizes[f"{labels[i]}_vs_{labels[j]}"] = d[i, j]
+        return effect_sizes
+    
+    def _flag_effect_size(self, flag_col: str) -> float:
+        """Cohen's d of popularity for rows where a boolean feature is set versus unset."""
+        _, d = _pairwise_cohens_d(
+            self.df['popularity'].to_numpy(dtype=np.float64),
+            self.df[flag_col].to_numpy(dtype=np.int8),
+            2
+        )
+        return d[1, 0]
+    
     def _analyse_title_features(self) -> Dict:
         """Analyse patterns in title features."""
         results = {}
         
         # Analyse numbers in titles
-        number_stats = self.df.groupby('has_numbers')['popularity'].agg([
-            'count', 'mean', 'std', 'median'
-        ]).to_dict()
+        number_stats = self._group_popularity_stats('has_numbers')
         
         # Analyse special characters
-        special_stats = self.df.groupby('has_special_chars')['popularity'].agg([
-            'count', 'mean', 'std', 'median'
-        ]).to_dict()
+        special_stats = self._group_popularity_stats('has_special_chars')
         
-        # Calculate effect sizes
-        number_effect = (self.df[self.df['has_numbers']]['popularity'].mean() -
-                        self.df[~self.df['has_numbers']]['popularity'].mean()) / np.sqrt(
-            (self.df[self.df['has_numbers']]['popularity'].var() +
-             self.df[~self.df['has_numbers']]['popularity'].var()) / 2
-        )
-        
-        special_effect = (self.df[self.df['has_special_chars']]['popularity'].mean() -
-                         self.df[~self.df['has_special_chars']]['popularity'].mean()) / np.sqrt(
-            (self.df[self.df['has_special_chars']]['popularity'].var() +
-             self.df[~self.df['has_special_chars']]['popularity'].var()) / 2
-        )
+        # Calculate effect sizes (titles with the feature vs without)
+        number_effect = self._flag_effect_size('has_numbers')
+        special_effect = self._flag_effect_size('has_special_chars')
         
         return {
             'numbers_in_titles': {
@@ -207,19 +291,13 @@ class SpotifyEDA:
         }
     
     def _check_statistical_assumptions(self) -> Dict:
-        """Check statistical assumptions for hypothesis testing."""
+        """Check statistical assumptions for hypothesis testing, reusing the cleaner's results when attached."""
         results = {}
+        shared = _compute_assumptions(self.df)
         
         # Normality tests
-        title_stat, title_p = stats.shapiro(self.df['title_length'].sample(5000))
-        word_stat, word_p = stats.shapiro(self.df['word_count'].sample(5000))
-        pop_stat, pop_p = stats.shapiro(self.df['popularity'].sample(5000))
-        
-        results['normality_tests'] = {
-            'title_length': {'statistic': title_stat, 'p_value': title_p},
-            'word_count': {'statistic': word_stat, 'p_value': word_p},
-            'popularity': {'statistic': pop_stat, 'p_value': pop_p}
-        }
+        results['normality_tests'] = shared['normality']
+        results['normality_test_used'] = shared['test_used']
         
         # Group size checks
         if 'word_count_group' in self.df.columns:
@@ -227,13 +305,8 @@ class SpotifyEDA:
             results['group_sizes'] = group_sizes.to_dict()
         
         # Variance homogeneity
-        if 'word_count_group' in self.df.columns:
-            groups = [group['popularity'].values for name, group in self.df.groupby('word_count_group')]
-            levene_stat, levene_p = stats.levene(*groups)
-            results['variance_homogeneity'] = {
-                'statistic': levene_stat,
-                'p_value': levene_p
-            }
+        if 'word_count_group' in shared['variance']:
+            results['variance_homogeneity'] = shared['variance']['word_count_group']
         
         return results
 
@@ -250,10 +323,11 @@ def run_exploratory_analysis():
     # Try to load cleaned data first, fallback to raw data
     try:
         # Look for most recent cleaned data
-        data_files = list(loader.data_dir.glob("spotify_cleaned_data_*.csv"))
+        data_files = list(loader.data_dir.glob("spotify_cleaned_data_*.parquet"))
+        data_files += loader.data_dir.glob("spotify_cleaned_data_*.csv")
         if data_files:
             latest_file = max(data_files, key=lambda x: x.stat().st_mtime)
-            df = pd.read_csv(latest_file)
+            df = loader.load_data(latest_file.name)
             print(f"📂 Using cleaned data: {latest_file}")
         else:
             print("📂 No cleaned data found, using raw data...")
@@ -8,14 +8,61 @@ that require understanding of data patterns discovered during EDA.
 
 import pandas as pd
 import numpy as np
+import json
 import logging
-from typing import Dict, List, Tuple, Optional
+from datetime import datetime
+from typing import Dict, List, Tuple, Optional, Union
 from pathlib import Path
 
+try:
+    import polars as pl
+    POLARS_AVAILABLE = True
+except ImportError:
+    POLARS_AVAILABLE = False
+
+try:
+    import orjson
+
+    def _dump_json(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _dump_json(obj) -> bytes:
+        return json.dumps(obj, indent=2, default=datetime.isoformat).encode()
+
+from .data_loader import CSV_DTYPES, save_csv, save_parquet
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Default cap on tracks kept per artist by the artist limiting strategy
+MAX_TRACKS_PER_ARTIST = 50
+
+# Artists whose track count is above this quantile of all artists' counts are outliers
+ARTIST_OUTLIER_QUANTILE = 0.99
+
+def _sample_keys(n_rows: int, seed: int) -> np.ndarray:
+    """Random sort key per row from a seeded PCG64 generator, shared by the pandas and Polars paths"""
+    return np.random.default_rng(seed).random(n_rows)
+
+def _sample_mask(groups: pd.Series, target_per_group: int, seed: int) -> np.ndarray:
+    """
+    Boolean mask keeping a uniform random sample of up to target_per_group rows per group
+    
+    Rows get a random key from a seeded PCG64 generator; sorting by (group, key) puts each
+    group's rows in random order, and a row is kept if it is among its group's first
+    target_per_group. Rows with a missing group are dropped.
+    """
+    codes, _ = pd.factorize(groups)
+    keys = _sample_keys(len(codes), seed)
+    order = np.lexsort((keys, codes))
+    sorted_codes = codes[order]
+    position = np.arange(len(order)) - np.searchsorted(sorted_codes, sorted_codes)
+    mask = np.zeros(len(codes), dtype=bool)
+    mask[order[position < target_per_group]] = True
+    mask[codes < 0] = False
+    return mask
+
 class PostEDADataCleaner:
     """
     Advanced data cleaning based on EDA insights
@@ -27,18 +74,43 @@ class PostEDADataCleaner:
     - Domain-specific outlier handling
     """
     
-    def __init__(self, df: pd.DataFrame, eda_results: Optional[Dict] = None):
+    def __init__(self, df: Union[pd.DataFrame, "pl.DataFrame"], eda_results: Optional[Dict] = None):
         """
         Initialize with cleaned data and optional EDA results
         
         Args:
-            df: DataFrame from basic cleaning (Step 4)
+            df: DataFrame from basic cleaning (Step 4), pandas or Polars
             eda_results: Dictionary of EDA findings to inform cleaning decisions
         """
-        self.df = df.copy()
+        # Not copied: every strategy filters into a new frame
+        self.df = self._downcast(df) if isinstance(df, pd.DataFrame) else df
         self.eda_results = eda_results or {}
         self.cleaned_df = None
         self.cleaning_report = {}
+        
+        # With Polars the strategies are chained onto one lazy plan, collected once
+        if POLARS_AVAILABLE:
+            self.lf = (self.df if isinstance(self.df, pl.DataFrame) else pl.from_pandas(self.df)).lazy()
+        else:
+            self.lf = None
+        self.plan = None
+    
+    @staticmethod
+    def _downcast(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Shrink columns to the loader's compact dtypes (Int8 popularity, category artist_name, ...)
+        
+        Columns already in that dtype, or whose values do not fit it, are left as they are
+        """
+        casts = {}
+        for col, dtype in CSV_DTYPES.items():
+            if col not in df.columns or df[col].dtype == dtype:
+                continue
+            try:
+                casts[col] = df[col].astype(dtype)
+            except (ValueError, TypeError):
+                logger.debug(f"Keeping {col} as {df[col].dtype}; values do not fit {dtype}")
+        return df.assign(**casts) if casts else df
     
     def apply_bias_correction(self, strategy: str = "auto") -> pd.DataFrame:
         """
@@ -60,7 +132,10 @@ class PostEDADataCleaner:
         print("=" * 50)
         print("Based on EDA findings, applying bias correction...")
         
-        self.cleaned_df = self.df.copy()
+        if self.lf is not None:
+            self.plan = self.lf
+        else:
+            self.cleaned_df = self.df
         
         if strategy == "auto":
             strategy = self._determine_optimal_strategy()
@@ -73,13 +148,33 @@ class PostEDADataCleaner:
             self._remove_artist_outliers()
         else:
             logger.warning(f"Unknown strategy: {strategy}. No bias correction applied.")
+            self._collect_plan()
             return self.cleaned_df
         
+        self._collect_plan()
         self._generate_cleaning_report()
         
         logger.info("✅ Post-EDA cleaning completed")
         return self.cleaned_df
     
+    def _collect_plan(self):
+        """Run the lazy Polars plan built by the strategy steps into cleaned_df"""
+        if self.plan is not None:
+            cleaned = self.plan.collect().to_pandas()
+            self.plan = None
+            if isinstance(self.df, pd.DataFrame):
+                # to_pandas gives plain dtypes and categories in row-appearance order; return
+                # the input's nullable and categorical dtypes, as the pandas path keeps them
+                restore = {}
+                for col, dtype in self.df.dtypes.items():
+                    if isinstance(dtype, pd.CategoricalDtype):
+                        # An unordered astype treats any category order as equal, so set them explicitly
+                        restore[col] = cleaned[col].cat.set_categories(dtype.categories, ordered=dtype.ordered)
+                    elif cleaned[col].dtype != dtype:
+                        restore[col] = cleaned[col].astype(dtype)
+                cleaned = cleaned.assign(**restore) if restore else cleaned
+            self.cleaned_df = cleaned
+    
     def _determine_optimal_strategy(self) -> str:
         """
         Determine optimal cleaning strategy based on EDA results
@@ -94,76 +189,131 @@ class PostEDADataCleaner:
         print("   (Implementation pending EDA results)")
         return "artist_limit"  # Default for now
     
-    def _apply_artist_limiting(self):
+    def _apply_artist_limiting(self, max_per_artist: int = MAX_TRACKS_PER_ARTIST):
         """
         Limit number of songs per artist to reduce skew
         
-        TODO: Implement with configurable limits per genre
+        Keeps each artist's most popular tracks (ties go to the earlier row), in original row order;
+        tracks without an artist are not limited
+        
+        Args:
+            max_per_artist: Maximum tracks kept per artist
         """
         print("🎯 Applying artist limiting strategy...")
-        print("   (Implementation pending - placeholder)")
+        print(f"   Keeping at most {max_per_artist} tracks per artist (most popular first)")
         
-        # Placeholder: Add logic to limit artists based on EDA findings
-        # Will implement specific limits after analyzing genre patterns
+        if self.plan is not None:
+            rank = pl.col('popularity').rank('ordinal', descending=True).over('artist_name')
+            self.plan = self.plan.filter((rank <= max_per_artist) | pl.col('artist_name').is_null())
+        else:
+            rank = self.cleaned_df.groupby('artist_name', observed=True, sort=False)['popularity'].rank(
+                method='first', ascending=False
+            )
+            keep = rank.le(max_per_artist).fillna(False) | self.cleaned_df['artist_name'].isna()
+            self.cleaned_df = self.cleaned_df.loc[keep.to_numpy()].reset_index(drop=True)
         
         self.cleaning_report['artist_limiting'] = {
             'applied': True,
-            'method': 'placeholder',
-            'parameters': 'TBD after EDA'
+            'method': 'top tracks by popularity per artist',
+            'parameters': f'max {max_per_artist} tracks per artist'
         }
     
-    def _apply_stratified_sampling(self):
+    def _apply_stratified_sampling(self, target_per_genre: Optional[int] = None, seed: int = 0):
         """
         Apply stratified sampling to maintain proportional representation
         
-        TODO: Implement stratified sampling logic
+        Draws up to target_per_genre random tracks from every genre in one pass, in original row order
+        
+        Args:
+            target_per_genre: Tracks kept per genre; defaults to the smallest genre's size
+            seed: Random seed, so repeated runs keep the same tracks
         """
         print("📊 Applying stratified sampling strategy...")
-        print("   (Implementation pending - placeholder)")
+        
+        if target_per_genre is None:
+            if self.plan is not None:
+                genre_sizes = (self.plan.drop_nulls('genre_category').group_by('genre_category').len()
+                               .select(pl.col('len').min()))
+                target_per_genre = genre_sizes.collect().item()
+            else:
+                target_per_genre = int(self.cleaned_df['genre_category'].value_counts().min())
+        print(f"   Sampling up to {target_per_genre:,} tracks per genre")
+        
+        if self.plan is not None:
+            # Same NumPy keys as _sample_mask, so both paths keep the same tracks for a seed
+            n_rows = self.plan.select(pl.len()).collect().item()
+            keys = pl.Series('_sample_key', _sample_keys(n_rows, seed))
+            position = pl.col('_sample_key').rank('ordinal').over('genre_category')
+            self.plan = (self.plan.with_columns(keys)
+                         .filter(pl.col('genre_category').is_not_null() & (position <= target_per_genre))
+                         .drop('_sample_key'))
+        else:
+            self.cleaned_df = self.cleaned_df.loc[
+                _sample_mask(self.cleaned_df['genre_category'], target_per_genre, seed)
+            ].reset_index(drop=True)
         
         self.cleaning_report['stratified_sampling'] = {
             'applied': True,
-            'method': 'placeholder',
-            'parameters': 'TBD after EDA'
+            'method': 'uniform random sample per genre',
+            'parameters': f'up to {target_per_genre} tracks per genre, seed {seed}'
         }
     
-    def _remove_artist_outliers(self):
+    def _remove_artist_outliers(self, quantile: float = ARTIST_OUTLIER_QUANTILE):
         """
-        Remove artists with extremely high song counts
+        Remove artists with extremely high song counts; tracks without an artist are kept
         
-        TODO: Implement outlier removal based on EDA thresholds
+        Args:
+            quantile: Artists with more tracks than this quantile of per-artist counts are removed
         """
         print("🚫 Removing artist outliers strategy...")
-        print("   (Implementation pending - placeholder)")
+        
+        if self.plan is not None:
+            artist_counts = self.plan.drop_nulls('artist_name').group_by('artist_name').len()
+            threshold = artist_counts.select(
+                pl.col('len').quantile(quantile, interpolation='linear')
+            ).collect().item()
+            self.plan = self.plan.filter(
+                (pl.len().over('artist_name') <= threshold) | pl.col('artist_name').is_null()
+            )
+        else:
+            artist_counts = self.cleaned_df['artist_name'].value_counts()
+            threshold = artist_counts.quantile(quantile)
+            outliers = set(artist_counts.index[artist_counts > threshold])
+            self.cleaned_df = self.cleaned_df.loc[
+                ~self.cleaned_df['artist_name'].isin(outliers).to_numpy()
+            ].reset_index(drop=True)
+        print(f"   Removing artists with more than {threshold:.1f} tracks ({quantile:.0%} quantile)")
         
         self.cleaning_report['outlier_removal'] = {
             'applied': True,
-            'method': 'placeholder',
-            'parameters': 'TBD after EDA'
+            'method': 'artist track-count quantile',
+            'parameters': f'max {threshold:.1f} tracks per artist ({quantile:.0%} quantile)'
         }
     
     def _generate_cleaning_report(self):
-        """Generate report of cleaning actions taken"""
-        print("\n📋 POST-EDA CLEANING REPORT")
-        print("-" * 40)
-        
+        """Generate report of cleaning actions taken, printed as one block"""
         original_count = len(self.df)
         cleaned_count = len(self.cleaned_df)
         
-        print(f"Original rows: {original_count:,}")
-        print(f"Cleaned rows: {cleaned_count:,}")
-        print(f"Rows removed: {original_count - cleaned_count:,}")
+        lines = [
+            "\n📋 POST-EDA CLEANING REPORT",
+            "-" * 40,
+            f"Original rows: {original_count:,}",
+            f"Cleaned rows: {cleaned_count:,}",
+            f"Rows removed: {original_count - cleaned_count:,}",
+        ]
         
         if original_count > 0:
             retention_rate = (cleaned_count / original_count) * 100
-            print(f"Retention rate: {retention_rate:.1f}%")
+            lines.append(f"Retention rate: {retention_rate:.1f}%")
         
         # Add detailed cleaning actions
         for action, details in self.cleaning_report.items():
-            print(f"\n✅ {action.replace('_', ' ').title()}:")
+            lines.append(f"\n✅ {action.replace('_', ' ').title()}:")
             if isinstance(details, dict):
-                for key, value in details.items():
-                    print(f"   {key}: {value}")
+                lines.extend(f"   {key}: {value}" for key, value in details.items())
+        
+        print("\n".join(lines))
     
     def get_cleaning_recommendations(self) -> List[str]:
         """
@@ -185,30 +335,41 @@ class PostEDADataCleaner:
         Export cleaned data with metadata
         
         Args:
-            output_path: Path to save cleaned dataset
+            output_path: Path to save cleaned dataset; a .parquet path writes only a
+                         Zstandard Parquet file with the metadata embedded, any other
+                         path writes CSV plus a Parquet copy and a metadata JSON file
         """
         if self.cleaned_df is None:
             logger.error("No cleaned data to export. Run apply_bias_correction() first.")
             return
         
-        # Save cleaned data
-        self.cleaned_df.to_csv(output_path, index=False)
-        
-        # Save cleaning metadata
-        metadata_path = output_path.replace('.csv', '_cleaning_metadata.json')
-        import json
-        
         metadata = {
             'original_rows': len(self.df),
             'cleaned_rows': len(self.cleaned_df),
             'cleaning_actions': self.cleaning_report,
-            'timestamp': pd.Timestamp.now().isoformat()
+            'timestamp': datetime.now()
         }
         
-        with open(metadata_path, 'w') as f:
-            json.dump(metadata, f, indent=2)
+        # The Parquet file carries the metadata itself, in its pandas attrs
+        export_df = self.cleaned_df.copy(deep=False)
+        export_df.attrs['cleaning_metadata'] = {**metadata, 'timestamp': metadata['timestamp'].isoformat()}
+        
+        if output_path.endswith('.parquet'):
+            # Parquet-only export: no CSV and no separate metadata file
+            save_parquet(export_df, output_path)
+            logger.info(f"Cleaned data and metadata exported to: {output_path}")
+            return
+        
+        # Save cleaned data, plus a Parquet copy for fast reloads
+        save_csv(self.cleaned_df, output_path)
+        parquet_path = save_parquet(export_df, output_path)
+        
+        # Save cleaning metadata alongside the CSV
+        metadata_path = output_path.replace('.csv', '_cleaning_metadata.json')
+        with open(metadata_path, 'wb') as f:
+            f.write(_dump_json(metadata))
         
-        logger.info(f"Cleaned data exported to: {output_path}")
+        logger.info(f"Cleaned data exported to: {output_path} (+ {parquet_path})")
         logger.info(f"Metadata saved to: {metadata_path}")
 
 
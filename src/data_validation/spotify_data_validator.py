@@ -10,19 +10,167 @@ Features:
 - Data profiling and documentation
 """
 
+import hashlib
 import os
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
-import pandas as pd
-import great_expectations as gx
-from great_expectations.core.batch import BatchRequest
-from great_expectations.checkpoint import Checkpoint
-from great_expectations.data_context import DataContext
-from great_expectations.exceptions import DataContextError
+from typing import TYPE_CHECKING, Dict, List, Tuple
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pv
+
+# Great Expectations is imported where it is used: its import tree is slow,
+# and the Polars fast path never needs it
+if TYPE_CHECKING:
+    from great_expectations.core.expectation_configuration import ExpectationConfiguration
+    from great_expectations.data_context import DataContext
+
+try:
+    import polars as pl
+    POLARS_AVAILABLE = True
+except ImportError:
+    POLARS_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Columns every collected dataset must contain
+REQUIRED_COLUMNS = frozenset([
+    'track_id', 'track_name', 'artist_id', 'artist_name',
+    'popularity', 'search_genre', 'release_date',
+    'title_word_count', 'title_complexity_tier'
+])
+EXPECTED_GENRES = frozenset(['pop', 'hip-hop', 'rock', 'electronic', 'country', 'r&b', 'alternative', 'classical'])
+EXPECTED_TIERS = frozenset(['single', 'short', 'medium', 'long'])
+# Fields that must never be null
+CRITICAL_FIELDS = frozenset(['track_id', 'track_name', 'artist_name', 'popularity', 'search_genre'])
+
+# Inclusive (min, max) bounds checked with expect_column_values_to_be_between
+VALUE_RANGES = {
+    'popularity': (0, 100),
+    'title_word_count': (1, 50),
+    'duration_ms': (30000, 1200000),  # 30 seconds to 20 minutes
+}
+
+# Known column types, applied when parsing CSVs instead of inferring them
+CSV_SCHEMA = pa.schema({
+    'track_id': pa.string(),
+    'track_name': pa.string(),
+    'artist_id': pa.string(),
+    'artist_name': pa.string(),
+    'popularity': pa.int16(),
+    'search_genre': pa.string(),
+    'release_date': pa.string(),
+    'duration_ms': pa.int32(),
+    'title_word_count': pa.int16(),
+    'title_complexity_tier': pa.string(),
+})
+POLARS_CSV_SCHEMA = pl.from_arrow(CSV_SCHEMA.empty_table()).schema if POLARS_AVAILABLE else None
+# Non-string schema columns; a file whose cells don't parse as these types is re-read leniently
+# and each of them gets an expect_column_values_to_be_of_type result
+TYPED_CSV_COLUMNS = tuple(field.name for field in CSV_SCHEMA if field.type != pa.string())
+TYPE_EXPECTATION = "expect_column_values_to_be_of_type"
+
+# Value sets for the fast path's is_in checks, built once rather than per validation
+# (imploded to a single list value, as is_in expects for a collection)
+if POLARS_AVAILABLE:
+    GENRE_VALUES = pl.Series('search_genre', sorted(EXPECTED_GENRES)).implode()
+    TIER_VALUES = pl.Series('title_complexity_tier', sorted(EXPECTED_TIERS)).implode()
+
+
+def _suite_version() -> str:
+    """Short hash of the suite definition, so a changed definition gets a fresh suite"""
+    definition = (
+        sorted(REQUIRED_COLUMNS), sorted(EXPECTED_GENRES), sorted(EXPECTED_TIERS),
+        sorted(CRITICAL_FIELDS), sorted(VALUE_RANGES.items())
+    )
+    return hashlib.sha1(repr(definition).encode()).hexdigest()[:8]
+
+
+SUITE_NAME = f"spotify_tracks_suite_{_suite_version()}"
+
+
+def _build_expectations() -> List["ExpectationConfiguration"]:
+    """Build the full Spotify track expectation list in one pass"""
+    from great_expectations.core.expectation_configuration import ExpectationConfiguration
+    
+    def expect(expectation_type: str, **kwargs) -> ExpectationConfiguration:
+        return ExpectationConfiguration(expectation_type=expectation_type, kwargs=kwargs)
+
+    # GE serialises value sets as JSON lists; sort them so the suite file is stable
+    genres = sorted(EXPECTED_GENRES)
+
+    return (
+        # === SCHEMA VALIDATION ===
+        [expect("expect_column_to_exist", column=column) for column in sorted(REQUIRED_COLUMNS)]
+        # === DATA QUALITY VALIDATION ===
+        + [
+            expect("expect_column_values_to_be_unique", column="track_id"),
+            expect("expect_column_value_lengths_to_be_between", column="track_name", min_value=1, max_value=200),
+        ]
+        # === BUSINESS RULES VALIDATION ===
+        + [
+            expect("expect_column_values_to_be_between", column=column, min_value=low, max_value=high)
+            for column, (low, high) in VALUE_RANGES.items()
+        ]
+        + [
+            expect("expect_column_values_to_be_in_set", column="search_genre", value_set=genres),
+            expect("expect_column_values_to_be_in_set", column="title_complexity_tier",
+                   value_set=sorted(EXPECTED_TIERS)),
+        ]
+        # === STATISTICAL DISTRIBUTION VALIDATION ===
+        + [
+            expect("expect_column_proportion_of_unique_values_to_be_between",
+                   column="popularity", min_value=0.01, max_value=1.0),
+            expect("expect_column_most_common_value_to_be_in_set", column="search_genre", value_set=genres),
+        ]
+        # === DATA COMPLETENESS ===
+        # Critical fields (track_id and track_name included) must be non-null
+        + [expect("expect_column_values_to_not_be_null", column=field) for field in sorted(CRITICAL_FIELDS)]
+    )
+
+
+def _read_csv_table(csv_path: str) -> Tuple[pa.Table, Dict[str, bool]]:
+    """
+    Parse a CSV with the known schema, falling back to a lenient parse when a cell doesn't fit it
+    
+    Returns:
+        Tuple of (table, type_checks); type_checks maps each typed column to whether all of its
+        cells parsed, and is empty when the strict parse succeeded
+    """
+    try:
+        return pv.read_csv(csv_path, convert_options=pv.ConvertOptions(column_types=CSV_SCHEMA)), {}
+    except pa.ArrowInvalid as e:
+        logger.warning(f"⚠️  CSV does not match the expected column types ({str(e).splitlines()[0]}); re-reading leniently")
+    
+    # Read the typed columns as text, then convert each one that parses cleanly; the
+    # reader's null markers are nulled first, as the strict parse would have done
+    options = pv.ConvertOptions(column_types={column: pa.string() if column in TYPED_CSV_COLUMNS else dtype
+                                              for column, dtype in zip(CSV_SCHEMA.names, CSV_SCHEMA.types)})
+    null_markers = pa.array(options.null_values, pa.string())
+    table = pv.read_csv(csv_path, convert_options=options)
+    type_checks = {}
+    for column in TYPED_CSV_COLUMNS:
+        if column not in table.column_names:
+            continue
+        index = table.column_names.index(column)
+        text = table.column(index)
+        text = pc.if_else(pc.is_in(text, value_set=null_markers), None, text)
+        try:
+            converted = pc.cast(text, CSV_SCHEMA.field(column).type)
+        except pa.ArrowInvalid:
+            type_checks[column] = False
+            continue
+        table = table.set_column(index, column, converted)
+        type_checks[column] = True
+    return table, type_checks
+
+
+def _log_failures(failures: List[Tuple[str, str]]):
+    """Log failed (expectation_type, column) pairs as one warning"""
+    if logger.isEnabledFor(logging.WARNING):
+        details = "".join(f"\n   FAILED: {expectation} on column '{column}'" for expectation, column in failures)
+        logger.warning("❌ Validation FAILED: %d expectations failed%s", len(failures), details)
+
 
 class SpotifyDataValidator:
     """
@@ -35,13 +183,29 @@ class SpotifyDataValidator:
     - Statistical distributions
     """
     
+    # Contexts and ready suites shared by every validator, keyed by gx_dir
+    _context_cache: Dict[str, "DataContext"] = {}
+    _suite_cache: Dict[str, str] = {}
+    
     def __init__(self, data_dir: str = "data"):
         self.data_dir = data_dir
         self.gx_dir = os.path.join(data_dir, "great_expectations")
-        self.context = self._initialize_gx_context()
+        self._context = None
+    
+    @property
+    def context(self) -> "DataContext":
+        """Great Expectations context, initialized on first use"""
+        if self._context is None:
+            self._context = self._initialize_gx_context()
+        return self._context
+        
+    def _initialize_gx_context(self) -> "DataContext":
+        """Initialize Great Expectations context, reusing one already loaded for this directory"""
+        if self.gx_dir in self._context_cache:
+            return self._context_cache[self.gx_dir]
+        
+        import great_expectations as gx
         
-    def _initialize_gx_context(self) -> DataContext:
-        """Initialize Great Expectations context"""
         try:
             # Try to get existing context
             if os.path.exists(self.gx_dir):
@@ -53,6 +217,7 @@ class SpotifyDataValidator:
                 context = gx.get_context(context_root_dir=self.gx_dir)
                 logger.info("✅ Created new Great Expectations context")
                 
+            self._context_cache[self.gx_dir] = context
             return context
             
         except Exception as e:
@@ -61,130 +226,33 @@ class SpotifyDataValidator:
     
     def create_expectation_suite(self) -> str:
         """Create comprehensive expectation suite for Spotify track data"""
-        suite_name = "spotify_tracks_suite"
+        suite_name = SUITE_NAME
+        if self._suite_cache.get(self.gx_dir) == suite_name:
+            return suite_name
+        
+        from great_expectations.exceptions import DataContextError
         
         try:
             # Create or get suite
             suite = self.context.get_expectation_suite(suite_name)
             logger.info(f"Using existing expectation suite: {suite_name}")
-        except:
+        except DataContextError:
             suite = self.context.create_expectation_suite(suite_name)
             logger.info(f"Created new expectation suite: {suite_name}")
             
-            # Clear existing expectations to start fresh
-            suite.expectations = []
-            
-            # === SCHEMA VALIDATION ===
-            logger.info("Adding schema validation expectations...")
-            
-            # Required columns must exist
-            required_columns = [
-                'track_id', 'track_name', 'artist_id', 'artist_name', 
-                'popularity', 'search_genre', 'release_date',
-                'title_word_count', 'title_complexity_tier'
-            ]
-            
-            for column in required_columns:
-                suite.add_expectation(
-                    expectation_configuration={
-                        "expectation_type": "expect_column_to_exist",
-                        "kwargs": {"column": column}
-                    }
-                )
-            
-            # === DATA QUALITY VALIDATION ===
-            logger.info("Adding data quality expectations...")
-            
-            # Track IDs should be unique and non-null
-            suite.add_expectation({
-                "expectation_type": "expect_column_values_to_be_unique",
-                "kwargs": {"column": "track_id"}
-            })
-            
-            suite.add_expectation({
-                "expectation_type": "expect_column_values_to_not_be_null",
-                "kwargs": {"column": "track_id"}
-            })
-            
-            # Track names should not be null or empty
-            suite.add_expectation({
-                "expectation_type": "expect_column_values_to_not_be_null",
-                "kwargs": {"column": "track_name"}
-            })
-            
-            suite.add_expectation({
-                "expectation_type": "expect_column_value_lengths_to_be_between",
-                "kwargs": {"column": "track_name", "min_value": 1, "max_value": 200}
-            })
-            
-            # === BUSINESS RULES VALIDATION ===
-            logger.info("Adding business rules expectations...")
-            
-            # Popularity should be between 0-100
-            suite.add_expectation({
-                "expectation_type": "expect_column_values_to_be_between",
-                "kwargs": {"column": "popularity", "min_value": 0, "max_value": 100}
-            })
-            
-            # Search genre should be from expected list
-            expected_genres = ['pop', 'hip-hop', 'rock', 'electronic', 'country', 'r&b', 'alternative', 'classical']
-            suite.add_expectation({
-                "expectation_type": "expect_column_values_to_be_in_set",
-                "kwargs": {"column": "search_genre", "value_set": expected_genres}
-            })
-            
-            # Title complexity tiers should be valid
-            expected_tiers = ['single', 'short', 'medium', 'long']
-            suite.add_expectation({
-                "expectation_type": "expect_column_values_to_be_in_set", 
-                "kwargs": {"column": "title_complexity_tier", "value_set": expected_tiers}
-            })
-            
-            # Word count should be positive and reasonable
-            suite.add_expectation({
-                "expectation_type": "expect_column_values_to_be_between",
-                "kwargs": {"column": "title_word_count", "min_value": 1, "max_value": 50}
-            })
-            
-            # Duration should be reasonable (30 seconds to 20 minutes)
-            suite.add_expectation({
-                "expectation_type": "expect_column_values_to_be_between",
-                "kwargs": {"column": "duration_ms", "min_value": 30000, "max_value": 1200000}
-            })
-            
-            # === STATISTICAL DISTRIBUTION VALIDATION ===
-            logger.info("Adding statistical distribution expectations...")
-            
-            # At least 5% of tracks should be high popularity (>75)
-            suite.add_expectation({
-                "expectation_type": "expect_column_proportion_of_unique_values_to_be_between",
-                "kwargs": {"column": "popularity", "min_value": 0.01, "max_value": 1.0}
-            })
-            
-            # Genre distribution should be reasonably balanced (no genre >60% of dataset)
-            suite.add_expectation({
-                "expectation_type": "expect_column_most_common_value_to_be_in_set",
-                "kwargs": {"column": "search_genre", "value_set": expected_genres}
-            })
-            
-            # === DATA COMPLETENESS ===
-            logger.info("Adding data completeness expectations...")
-            
-            # Critical fields should have <5% null values
-            critical_fields = ['track_id', 'track_name', 'artist_name', 'popularity', 'search_genre']
-            for field in critical_fields:
-                suite.add_expectation({
-                    "expectation_type": "expect_column_values_to_not_be_null",
-                    "kwargs": {"column": field}
-                })
+            # Build every expectation up front and assign them in one go, rather than
+            # re-validating the suite on each add_expectation call
+            logger.info("Adding schema, data quality, business rule and completeness expectations...")
+            suite.expectations = _build_expectations()
             
             # Save the suite
             self.context.save_expectation_suite(suite)
             logger.info(f"✅ Expectation suite '{suite_name}' created with {len(suite.expectations)} expectations")
             
+        self._suite_cache[self.gx_dir] = suite_name
         return suite_name
     
-    def validate_dataset(self, csv_path: str, suite_name: str = "spotify_tracks_suite") -> Tuple[bool, Dict]:
+    def validate_dataset(self, csv_path: str, suite_name: str = SUITE_NAME) -> Tuple[bool, Dict]:
         """
         Validate a dataset against the expectation suite
         
@@ -202,16 +270,21 @@ class SpotifyDataValidator:
             except:
                 datasource = self.context.sources.add_pandas(datasource_name)
                 
+            # Parse the CSV with Arrow using the known schema and hand GE the frame,
+            # rather than letting GE's pandas reader infer every column's type
+            table, type_checks = _read_csv_table(csv_path)
+            df = table.to_pandas()
+            
             # Add data asset
             asset_name = f"tracks_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
             try:
-                data_asset = datasource.add_csv_asset(asset_name, filepath_or_buffer=csv_path)
+                data_asset = datasource.add_dataframe_asset(asset_name)
             except:
                 # Asset might already exist, get it
                 data_asset = datasource.get_asset(asset_name)
             
             # Create batch request
-            batch_request = data_asset.build_batch_request()
+            batch_request = data_asset.build_batch_request(dataframe=df)
             
             # Create validator
             validator = self.context.get_validator(
@@ -222,42 +295,47 @@ class SpotifyDataValidator:
             # Run validation
             validation_result = validator.validate()
             
+            # Tally results and collect failures in a single pass
+            failures = [
+                (r.expectation_config.expectation_type, r.expectation_config.kwargs.get('column', 'N/A'))
+                for r in validation_result.results if not r.success
+            ]
+            # Columns whose cells didn't fit the schema are reported as failed type expectations
+            failures += [(TYPE_EXPECTATION, column) for column, parsed in type_checks.items() if not parsed]
+            total = len(validation_result.results) + len(type_checks)
+            success = not failures
+            
             # Extract key metrics
             results_summary = {
-                'validation_passed': validation_result.success,
-                'total_expectations': len(validation_result.results),
-                'successful_expectations': sum(1 for r in validation_result.results if r.success),
-                'failed_expectations': sum(1 for r in validation_result.results if not r.success),
-                'evaluated_expectations': validation_result.statistics['evaluated_expectations'],
-                'success_percentage': validation_result.statistics['success_percent'],
-                'dataset_rows': len(validator.active_batch.data),
-                'dataset_columns': len(validator.active_batch.data.columns),
+                'validation_passed': success,
+                'total_expectations': total,
+                'successful_expectations': total - len(failures),
+                'failed_expectations': len(failures),
+                'evaluated_expectations': validation_result.statistics['evaluated_expectations'] + len(type_checks),
+                'success_percentage': 100.0 * (total - len(failures)) / total,
+                'dataset_rows': table.num_rows,
+                'dataset_columns': table.num_columns,
                 'validation_time': datetime.now().isoformat()
             }
             
             # Log summary
-            if validation_result.success:
+            if success:
                 logger.info(f"✅ Validation PASSED: {results_summary['successful_expectations']}/{results_summary['total_expectations']} expectations met")
             else:
-                logger.warning(f"❌ Validation FAILED: {results_summary['failed_expectations']} expectations failed")
-                
-                # Log failed expectations
-                for result in validation_result.results:
-                    if not result.success:
-                        expectation = result.expectation_config.expectation_type
-                        column = result.expectation_config.kwargs.get('column', 'N/A')
-                        logger.warning(f"   FAILED: {expectation} on column '{column}'")
+                _log_failures(failures)
             
-            return validation_result.success, results_summary
+            return success, results_summary
             
         except Exception as e:
             logger.error(f"Validation failed with error: {e}")
             return False, {"error": str(e)}
     
-    def create_checkpoint(self, suite_name: str = "spotify_tracks_suite") -> str:
+    def create_checkpoint(self, suite_name: str = SUITE_NAME) -> str:
         """Create a validation checkpoint for automated testing"""
         checkpoint_name = "spotify_data_checkpoint"
         
+        from great_expectations.checkpoint import Checkpoint
+        
         try:
             checkpoint_config = {
                 "name": checkpoint_name,
@@ -344,38 +422,168 @@ class SpotifyDataValidator:
             logger.error(f"Quick validation failed: {e}")
             return False
     
-    def _print_validation_summary(self, success: bool, results: Dict, docs_url: str):
-        """Print comprehensive validation summary"""
-        print("\n" + "="*60)
-        print("📊 DATA VALIDATION SUMMARY")
-        print("="*60)
+    def quick_validate_polars(self, csv_path: str) -> bool:
+        """Fast-path validation that skips Great Expectations and scans the CSV once with Polars"""
+        logger.info("🚀 Running Polars fast-path validation...")
+        
+        if not POLARS_AVAILABLE:
+            logger.warning("Polars not installed, falling back to Great Expectations validation")
+            return self.quick_validate(csv_path)
+        
+        try:
+            success, results = self.validate_dataset_polars(csv_path)
+            self._print_validation_summary(success, results, "")
+            return success
+            
+        except Exception as e:
+            logger.error(f"Polars validation failed: {e}")
+            return False
+    
+    def validate_dataset_polars(self, csv_path: str) -> Tuple[bool, Dict]:
+        """
+        Evaluate the expectation suite's checks as one Polars aggregate query
+        
+        Returns:
+            Tuple of (validation_passed, validation_results) in the same shape as validate_dataset
+        """
+        logger.info(f"🔍 Validating dataset (Polars): {csv_path}")
+        
+        try:
+            lf = pl.scan_csv(csv_path, schema_overrides=POLARS_CSV_SCHEMA)
+            return self._validate_scan(lf, set(lf.collect_schema().names()), [])
+        except pl.exceptions.ComputeError as e:
+            logger.warning(f"⚠️  CSV does not match the expected column types ({str(e).splitlines()[0]}); re-reading leniently")
+        
+        # Read the typed columns as text and convert them non-strictly; a cell that was
+        # present but didn't convert counts against that column's type expectation
+        lf = pl.scan_csv(csv_path, schema_overrides={column: pl.String for column in TYPED_CSV_COLUMNS})
+        present = set(lf.collect_schema().names())
+        typed = [column for column in TYPED_CSV_COLUMNS if column in present]
+        lf = lf.with_columns(
+            *[pl.col(column).cast(POLARS_CSV_SCHEMA[column], strict=False) for column in typed],
+            *[pl.col(column).alias(f"{column}__text") for column in typed]
+        )
+        return self._validate_scan(lf, present, typed)
+    
+    def _validate_scan(self, lf: "pl.LazyFrame", present: set, typed: List[str]) -> Tuple[bool, Dict]:
+        """Evaluate the expectation checks on a scanned CSV; typed lists columns needing a type check"""
+        # Fuse every check on a column into plain per-column aggregates (min/max, null and
+        # unique counts), so each column is read once however many expectations use it
+        stats = {"rows": pl.len()}
+        for column in VALUE_RANGES.keys() & present:
+            stats[f"{column}_min"] = pl.col(column).min()
+            stats[f"{column}_max"] = pl.col(column).max()
+        for column in {"track_id", "popularity"} & present:
+            stats[f"{column}_count"] = pl.col(column).count()
+            stats[f"{column}_unique"] = pl.col(column).drop_nulls().n_unique()
+        for column in CRITICAL_FIELDS & present:
+            # Unparseable cells are left to the type check rather than counted as missing
+            stats[f"{column}_nulls"] = pl.col(f"{column}__text" if column in typed else column).null_count()
+        if "track_name" in present:
+            lengths = pl.col("track_name").str.len_chars()
+            stats["track_name_min"] = lengths.min()
+            stats["track_name_max"] = lengths.max()
+        if "search_genre" in present:
+            stats["search_genre_in_set"] = pl.col("search_genre").is_in(GENRE_VALUES).all()
+            stats["search_genre_mode_in_set"] = pl.col("search_genre").drop_nulls().mode().is_in(GENRE_VALUES).all()
+        if "title_complexity_tier" in present:
+            stats["title_complexity_tier_in_set"] = pl.col("title_complexity_tier").is_in(TIER_VALUES).all()
+        for column in typed:
+            stats[f"{column}_type_errors"] = (pl.col(f"{column}__text").is_not_null() & pl.col(column).is_null()).sum()
+        
+        # The streaming engine evaluates the aggregates batch by batch, so files larger than RAM still validate
+        row = lf.select(**stats).collect(engine="streaming").row(0, named=True)
+        
+        def between(column: str, low: float, high: float) -> bool:
+            # Nulls are ignored, as in GE; an all-null column has no min/max and passes
+            col_min, col_max = row[f"{column}_min"], row[f"{column}_max"]
+            return col_min is None or (low <= col_min and col_max <= high)
+        
+        # Each check is (expectation_type, column, threshold test on the aggregates)
+        checks = [
+            # One hash pass over the column; nulls are left to the not-null check, as in GE
+            ("expect_column_values_to_be_unique", "track_id",
+             lambda: row["track_id_unique"] == row["track_id_count"]),
+            ("expect_column_value_lengths_to_be_between", "track_name", lambda: between("track_name", 1, 200)),
+        ]
+        checks += [
+            ("expect_column_values_to_be_between", column, lambda c=column, lo=low, hi=high: between(c, lo, hi))
+            for column, (low, high) in VALUE_RANGES.items()
+        ]
+        checks += [
+            ("expect_column_values_to_be_in_set", "search_genre", lambda: row["search_genre_in_set"]),
+            ("expect_column_values_to_be_in_set", "title_complexity_tier",
+             lambda: row["title_complexity_tier_in_set"]),
+            ("expect_column_proportion_of_unique_values_to_be_between", "popularity",
+             lambda: row["popularity_count"] > 0
+             and 0.01 <= row["popularity_unique"] / row["popularity_count"] <= 1.0),
+            ("expect_column_most_common_value_to_be_in_set", "search_genre",
+             lambda: row["search_genre_mode_in_set"]),
+        ]
+        checks += [
+            ("expect_column_values_to_not_be_null", field, lambda f=field: row[f"{f}_nulls"] == 0)
+            for field in sorted(CRITICAL_FIELDS)
+        ]
+        
+        # A check on a missing column fails without being evaluated
+        outcomes = [("expect_column_to_exist", column, column in present) for column in sorted(REQUIRED_COLUMNS)]
+        outcomes += [(TYPE_EXPECTATION, column, row[f"{column}_type_errors"] == 0) for column in typed]
+        outcomes += [
+            (expectation, column, column in present and bool(test()))
+            for expectation, column, test in checks
+        ]
+        failures = [(expectation, column) for expectation, column, passed in outcomes if not passed]
         
-        if success:
-            print("✅ VALIDATION PASSED")
+        total = len(outcomes)
+        results_summary = {
+            'validation_passed': not failures,
+            'total_expectations': total,
+            'successful_expectations': total - len(failures),
+            'failed_expectations': len(failures),
+            'evaluated_expectations': total,
+            'success_percentage': 100.0 * (total - len(failures)) / total,
+            'dataset_rows': row['rows'],
+            'dataset_columns': len(present),
+            'validation_time': datetime.now().isoformat()
+        }
+        
+        if not failures:
+            logger.info(f"✅ Validation PASSED: {total}/{total} expectations met")
         else:
-            print("❌ VALIDATION FAILED")
+            _log_failures(failures)
+        
+        return not failures, results_summary
+    
+    def _print_validation_summary(self, success: bool, results: Dict, docs_url: str):
+        """Print comprehensive validation summary as one block"""
+        lines = [
+            "\n" + "="*60,
+            "📊 DATA VALIDATION SUMMARY",
+            "="*60,
+            "✅ VALIDATION PASSED" if success else "❌ VALIDATION FAILED",
+        ]
             
         if 'error' not in results:
-            print(f"📋 Dataset: {results['dataset_rows']:,} rows, {results['dataset_columns']} columns")
-            print(f"🎯 Expectations: {results['successful_expectations']}/{results['total_expectations']} passed ({results['success_percentage']:.1f}%)")
+            lines.append(f"📋 Dataset: {results['dataset_rows']:,} rows, {results['dataset_columns']} columns")
+            lines.append(f"🎯 Expectations: {results['successful_expectations']}/{results['total_expectations']} passed ({results['success_percentage']:.1f}%)")
             
             if not success:
-                print(f"⚠️  Failed expectations: {results['failed_expectations']}")
-                print("💡 Check logs above for specific failures")
+                lines.append(f"⚠️  Failed expectations: {results['failed_expectations']}")
+                lines.append("💡 Check logs above for specific failures")
                 
         if docs_url:
-            print(f"📖 Data docs: {docs_url}")
-            print("💡 Open the docs URL to see detailed validation results")
+            lines.append(f"📖 Data docs: {docs_url}")
+            lines.append("💡 Open the docs URL to see detailed validation results")
             
-        print("="*60)
-
+        lines.append("="*60)
+        print("\n".join(lines))
 
 def main():
     """Main function for standalone validation"""
     import sys
     
     if len(sys.argv) < 2:
-        print("Usage: python spotify_data_validator.py <path_to_csv>")
+        print("Usage: python spotify_data_validator.py <path_to_csv> [--fast]")
         sys.exit(1)
         
     csv_path = sys.argv[1]
@@ -386,7 +594,10 @@ def main():
         
     # Run validation
     validator = SpotifyDataValidator()
-    success = validator.quick_validate(csv_path)
+    if "--fast" in sys.argv[2:]:
+        success = validator.quick_validate_polars(csv_path)
+    else:
+        success = validator.quick_validate(csv_path)
     
     sys.exit(0 if success else 1)
 
@@ -5,8 +5,8 @@ This module provides interpretation and analysis of statistical test results
 from the title complexity hypothesis testing framework.
 """
 
+import io
 import numpy as np
-import pandas as pd
 from typing import Dict, List, Optional, Tuple
 import logging
 
@@ -25,6 +25,34 @@ class ResultsInterpreter:
     - Effect size evaluations
     """
     
+    # |r| bucket edges: below 0.1 negligible, then small, medium, and large from 0.5 up
+    _EFFECT_EDGES = np.array([0.1, 0.3, 0.5])
+    _EFFECT_LABELS = ("negligible", "small", "medium", "large")
+    
+    # Interpretation text, formatted through bound str.format methods built once per class
+    _CORR_SUMMARY = "r = {corr:.3f}, p = {p:.3f}".format
+    _CORR_INTERP = "There is a {sig} {dir} {effect} correlation between {v1} and {v2}.".format
+    _GROUP_SUMMARY = "Test statistic = {stat:.3f}, p = {p:.3f}".format
+    _GROUP_INTERP = "The difference between {name} is {sig}.".format
+    _ANOVA_SUMMARY = "F = {f:.3f}, p = {p:.3f}".format
+    _ANOVA_INTERP = "The effect of {name} on popularity is {sig}.".format
+    
+    _REPORT_HEADER = "\n".join([
+        "=" * 60,
+        "SPOTIFY TITLE ANALYSIS - STATISTICAL RESULTS SUMMARY",
+        "=" * 60,
+        "\n📊 EXECUTIVE SUMMARY",
+        "-" * 30,
+    ])
+    _DETAILS_HEADER = "\n🔍 DETAILED STATISTICAL RESULTS\n" + "-" * 40
+    _METHODOLOGY = "\n".join([
+        "\n📝 METHODOLOGY",
+        "-" * 20,
+        "  • Significance level: α = 0.05",
+        "  • Effect sizes: negligible (<0.1), small (0.1-0.3), medium (0.3-0.5), large (>0.5)",
+        "  • Statistical tests selected based on data distribution and sample size",
+    ])
+    
     def __init__(self, test_results: Dict):
         """
         Initialize with test results from StatisticalTests
@@ -35,40 +63,51 @@ class ResultsInterpreter:
         self.results = test_results
         self.interpretations = {}
         self.business_insights = []
+        # Display title per interpretation key, e.g. 'title_length' -> 'Title Length'
+        self._display_titles = {}
     
-    def interpret_all_results(self) -> Dict:
+    def interpret_all_results(self, report_io: Optional[io.StringIO] = None,
+                              keep_dict: bool = True) -> Dict:
         """
         Interpret all statistical test results
         
+        Args:
+            report_io: If given, the summary report is written to it in the same pass
+            keep_dict: If False, interpretations are not kept on the instance
+                (for callers that only want the report)
+        
         Returns:
-            Dictionary containing interpretations for all tests
+            Dictionary containing interpretations for all tests (empty if keep_dict is False)
         """
         logger.info("🔍 Interpreting statistical test results...")
         
-        # Interpret correlation analysis
-        if 'title_length_correlation' in self.results:
-            self.interpretations['title_length'] = self._interpret_correlation(
-                self.results['title_length_correlation'], 
-                'title length', 
-                'popularity'
-            )
-        
-        # Interpret group comparisons
-        if 'word_count_groups' in self.results:
-            self.interpretations['word_count'] = self._interpret_group_comparison(
-                self.results['word_count_groups'],
-                'word count groups'
-            )
-        
-        # Interpret ANOVA results
-        if 'title_features_anova' in self.results:
-            self.interpretations['title_features'] = self._interpret_anova(
-                self.results['title_features_anova'],
-                'title features'
-            )
+        # (result key, interpretation key, interpreter, extra arguments) in report order
+        tests = [
+            ('title_length_correlation', 'title_length', self._interpret_correlation, ('title length', 'popularity')),
+            ('word_count_groups', 'word_count', self._interpret_group_comparison, ('word count groups',)),
+            ('title_features_anova', 'title_features', self._interpret_anova, ('title features',)),
+        ]
+        
+        # Per test, only what the business insights and the report read
+        summaries = []
+        details = []
+        for result_key, key, interpret, args in tests:
+            if result_key not in self.results:
+                continue
+            interp = interpret(self.results[result_key], *args)
+            title = key.replace('_', ' ').title()
+            summaries.append((title, interp['significance'] == 'significant', interp['business_implication']))
+            if report_io is not None:
+                details.append(self._format_details(title, interp))
+            if keep_dict:
+                self.interpretations[key] = interp
+                self._display_titles[key] = title
         
         # Generate business insights
-        self._generate_business_insights()
+        self._generate_business_insights(summaries)
+        
+        if report_io is not None:
+            self._write_report(report_io, details)
         
         logger.info("✅ Results interpretation complete")
         return self.interpretations
@@ -93,24 +132,17 @@ class ResultsInterpreter:
         significance_level = "significant" if is_significant else "not significant"
         
         # Determine effect size
-        if abs(corr) < 0.1:
-            effect_size = "negligible"
-        elif abs(corr) < 0.3:
-            effect_size = "small"
-        elif abs(corr) < 0.5:
-            effect_size = "medium"
-        else:
-            effect_size = "large"
+        effect_size = self._EFFECT_LABELS[int(np.searchsorted(self._EFFECT_EDGES, abs(corr), side='right'))]
         
         # Determine direction
         direction = "positive" if corr > 0 else "negative"
         
         interpretation = {
-            'statistical_summary': f"r = {corr:.3f}, p = {p_value:.3f}",
+            'statistical_summary': self._CORR_SUMMARY(corr=corr, p=p_value),
             'significance': significance_level,
             'effect_size': effect_size,
             'direction': direction,
-            'interpretation': f"There is a {significance_level} {direction} {effect_size} correlation between {var1} and {var2}.",
+            'interpretation': self._CORR_INTERP(sig=significance_level, dir=direction, effect=effect_size, v1=var1, v2=var2),
             'business_implication': self._get_correlation_business_insight(var1, var2, corr, is_significant),
             'recommendations': [
                 f"Analyse {var1} patterns by genre",
@@ -140,9 +172,9 @@ class ResultsInterpreter:
         significance_level = "significant" if is_significant else "not significant"
         
         interpretation = {
-            'statistical_summary': f"Test statistic = {test_statistic:.3f}, p = {p_value:.3f}",
+            'statistical_summary': self._GROUP_SUMMARY(stat=test_statistic, p=p_value),
             'significance': significance_level,
-            'interpretation': f"The difference between {group_name} is {significance_level}.",
+            'interpretation': self._GROUP_INTERP(name=group_name, sig=significance_level),
             'business_implication': self._get_group_business_insight(group_name, is_significant),
             'recommendations': [
                 f"Analyse {group_name} patterns by genre",
@@ -172,9 +204,9 @@ class ResultsInterpreter:
         significance_level = "significant" if is_significant else "not significant"
         
         interpretation = {
-            'statistical_summary': f"F = {f_statistic:.3f}, p = {p_value:.3f}",
+            'statistical_summary': self._ANOVA_SUMMARY(f=f_statistic, p=p_value),
             'significance': significance_level,
-            'interpretation': f"The effect of {factor_name} on popularity is {significance_level}.",
+            'interpretation': self._ANOVA_INTERP(name=factor_name, sig=significance_level),
             'business_implication': self._get_anova_business_insight(factor_name, is_significant),
             'recommendations': [
                 f"Analyse {factor_name} patterns by genre",
@@ -212,14 +244,20 @@ class ResultsInterpreter:
         
         return f"{factor_name} significantly impacts popularity. Develop factor-specific optimisation strategies."
     
-    def _generate_business_insights(self):
-        """Generate overall business insights from all test results"""
+    def _generate_business_insights(self, summaries: List[Tuple[str, bool, str]]):
+        """
+        Generate overall business insights from all test results
+        
+        Args:
+            summaries: (display title, is significant, business implication) per test
+        """
         insights = []
         
-        # Count significant results
-        significant_tests = sum(1 for interp in self.interpretations.values() 
-                              if interp['significance'] == 'significant')
-        total_tests = len(self.interpretations)
+        # Count significant results; the flags also select the per-test insights below
+        sig_flags = np.fromiter((significant for _, significant, _ in summaries),
+                                dtype=bool, count=len(summaries))
+        significant_tests = int(sig_flags.sum())
+        total_tests = len(summaries)
         
         if significant_tests == 0:
             insights.append("🔍 No significant title feature relationships detected. Consider expanding analysis scope.")
@@ -229,12 +267,36 @@ class ResultsInterpreter:
             insights.append(f"📊 {significant_tests}/{total_tests} title features show significant relationships. Focus optimisation efforts on significant factors.")
         
         # Add specific insights based on patterns
-        for test_name, interp in self.interpretations.items():
-            if interp['significance'] == 'significant':
-                insights.append(f"✅ {test_name.replace('_', ' ').title()}: {interp['business_implication']}")
+        for (title, _, implication), significant in zip(summaries, sig_flags):
+            if significant:
+                insights.append(f"✅ {title}: {implication}")
         
         self.business_insights = insights
     
+    @staticmethod
+    def _format_details(title: str, interp: Dict) -> str:
+        """Format the detailed report block for one test"""
+        lines = [
+            f"\n{title.upper()}:",
+            f"  Statistical: {interp['statistical_summary']}",
+            f"  Result: {interp['interpretation']}",
+            f"  Business: {interp['business_implication']}",
+            "  Recommendations:",
+        ]
+        if interp['recommendations']:
+            lines.append("    • " + "\n    • ".join(interp['recommendations']))
+        return "\n".join(lines)
+    
+    def _write_report(self, report_io: io.StringIO, details: List[str]):
+        """Write the summary report from the insights and formatted test blocks"""
+        report_io.write(self._REPORT_HEADER)
+        for insight in self.business_insights:
+            report_io.write(f"\n  {insight}")
+        report_io.write("\n" + self._DETAILS_HEADER)
+        for block in details:
+            report_io.write("\n" + block)
+        report_io.write("\n" + self._METHODOLOGY)
+    
     def generate_summary_report(self) -> str:
         """
         Generate a comprehensive summary report
@@ -242,39 +304,11 @@ class ResultsInterpreter:
         Returns:
             Formatted string containing full results summary
         """
-        report = []
-        report.append("=" * 60)
-        report.append("SPOTIFY TITLE ANALYSIS - STATISTICAL RESULTS SUMMARY")
-        report.append("=" * 60)
-        
-        # Executive summary
-        report.append("\n📊 EXECUTIVE SUMMARY")
-        report.append("-" * 30)
-        for insight in self.business_insights:
-            report.append(f"  {insight}")
-        
-        # Detailed results
-        report.append("\n🔍 DETAILED STATISTICAL RESULTS")
-        report.append("-" * 40)
-        
-        for test_name, interp in self.interpretations.items():
-            report.append(f"\n{test_name.replace('_', ' ').upper()}:")
-            report.append(f"  Statistical: {interp['statistical_summary']}")
-            report.append(f"  Result: {interp['interpretation']}")
-            report.append(f"  Business: {interp['business_implication']}")
-            
-            report.append("  Recommendations:")
-            for rec in interp['recommendations']:
-                report.append(f"    • {rec}")
-        
-        # Methodology note
-        report.append(f"\n📝 METHODOLOGY")
-        report.append("-" * 20)
-        report.append("  • Significance level: α = 0.05")
-        report.append("  • Effect sizes: negligible (<0.1), small (0.1-0.3), medium (0.3-0.5), large (>0.5)")
-        report.append("  • Statistical tests selected based on data distribution and sample size")
-        
-        return "\n".join(report)
+        details = [self._format_details(self._display_titles[test_name], interp)
+                   for test_name, interp in self.interpretations.items()]
+        report_io = io.StringIO()
+        self._write_report(report_io, details)
+        return report_io.getvalue()
 
 
 def run_results_interpretation():
@@ -7,13 +7,65 @@ and their relationship with popularity.
 
 import pandas as pd
 import numpy as np
-from scipy import stats
 from typing import Dict, List, Tuple, Optional
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 
-@dataclass
+from .test_setup import _contiguous_columns
+
+def _grouped_moments_numpy(codes: np.ndarray, values: np.ndarray, n_groups: int):
+    """
+    Per-group count, sum and sum of squares of values; codes of -1 are ignored.
+    """
+    valid = codes >= 0
+    codes, values = codes[valid], values[valid]
+    counts = np.bincount(codes, minlength=n_groups).astype(np.float64)
+    sums = np.bincount(codes, weights=values, minlength=n_groups)
+    sumsqs = np.bincount(codes, weights=values * values, minlength=n_groups)
+    return counts, sums, sumsqs
+
+def _grouped_moments_kernel(codes: np.ndarray, values: np.ndarray, n_groups: int):
+    """Single-pass loop version of _grouped_moments_numpy, compiled with numba."""
+    counts = np.zeros(n_groups)
+    sums = np.zeros(n_groups)
+    sumsqs = np.zeros(n_groups)
+    for k in range(values.shape[0]):
+        g = codes[k]
+        if g < 0:
+            continue
+        counts[g] += 1
+        sums[g] += values[k]
+        sumsqs[g] += values[k] * values[k]
+    return counts, sums, sumsqs
+
+@lru_cache(maxsize=None)
+def _grouped_moments_impl():
+    """Compile the numba kernel on first use, so importing this module never loads numba."""
+    try:
+        from numba import njit
+    except ImportError:
+        return _grouped_moments_numpy
+    return njit(cache=True)(_grouped_moments_kernel)
+
+def _grouped_moments(codes: np.ndarray, values: np.ndarray, n_groups: int):
+    """Per-group count, sum and sum of squares, with numba when it is installed."""
+    return _grouped_moments_impl()(codes, values, n_groups)
+
+# Compact plain NumPy dtypes the analyzer works on; popularity (0-100) is exact in float32
+ANALYSIS_DTYPES = {
+    'has_special_chars': np.bool_,
+    'title_length': np.int32,
+    'word_count': np.int16,
+    'popularity': np.float32,
+}
+
+def _now() -> str:
+    """Current time in the format results are stamped with"""
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+@dataclass(slots=True)
 class TestResult:
     """Data class for storing test results"""
     test_name: str
@@ -22,14 +74,55 @@ class TestResult:
     p_value: float
     effect_size: float
     conclusion: str
-    timestamp: str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    # Stamped when each result is created, not once at import
+    timestamp: str = field(default_factory=_now)
 
 class TitleFeatureAnalyzer:
     """Analyses title features using statistical tests"""
     
+    # Effect size bucket edges; a value above an edge moves to the next label
+    _CORRELATION_EDGES = np.array([0.3, 0.5])
+    _CORRELATION_LABELS = ("weak", "moderate", "strong")
+    _ETA_SQUARED_EDGES = np.array([0.06, 0.14])
+    _COHENS_D_EDGES = np.array([0.5, 0.8])
+    _EFFECT_LABELS = ("small", "medium", "large")
+    # Word count groups for the ANOVA: (0, 1], (1, 3], (3, 5] and (5, inf)
+    _WORD_COUNT_LABELS = np.array(['Single', 'Short', 'Medium', 'Long'])
+    
     def __init__(self, data: pd.DataFrame):
-        self.data = data
+        # Compact dtypes first, then contiguous storage for any column the casts did not rewrite
+        self.data = _contiguous_columns(self._coerce_dtypes(data), ANALYSIS_DTYPES)
         self.results: List[TestResult] = []
+        # Popularity is read by every test; extract it and its moments once. It is held as
+        # float32 (exact for 0-100) to halve the bytes each scan moves, while every
+        # reduction over it accumulates in float64
+        self._pop = self.data['popularity'].to_numpy(dtype=np.float32, na_value=np.nan)
+        self._pop_mean = float(self._pop.mean(dtype=np.float64))
+        self._pop_var = float(self._pop.var(dtype=np.float64))
+        self._pop_centered = None
+    
+    @staticmethod
+    def _coerce_dtypes(data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Cast the analysed columns to ANALYSIS_DTYPES at ingest
+        
+        Columns with missing values stay nullable, and popularity is only narrowed from an
+        integer dtype, so no values change
+        """
+        casts = {}
+        for col, dtype in ANALYSIS_DTYPES.items():
+            if col not in data.columns or data[col].dtype == dtype or data[col].hasnans:
+                continue
+            if col == 'popularity' and not pd.api.types.is_integer_dtype(data[col]):
+                continue
+            try:
+                cast = data[col].astype(dtype)
+            except (ValueError, TypeError):
+                continue
+            # astype truncates and wraps silently, so keep the cast only if every value survived
+            if np.array_equal(cast.to_numpy(), data[col].to_numpy()):
+                casts[col] = cast
+        return data.assign(**casts) if casts else data
     
     def run_all_tests(self) -> List[TestResult]:
         """Run all statistical tests for title features"""
@@ -40,10 +133,7 @@ class TitleFeatureAnalyzer:
     
     def _test_title_length_correlation(self) -> None:
         """Test correlation between title length and popularity"""
-        correlation, p_value = stats.pearsonr(
-            self.data['title_length'],
-            self.data['popularity']
-        )
+        correlation, p_value = self._pearson(self.data['title_length'].to_numpy(dtype=np.float32))
         
         result = TestResult(
             test_name="Title Length Correlation",
@@ -55,23 +145,58 @@ class TitleFeatureAnalyzer:
         )
         self.results.append(result)
     
+    def _pearson(self, x: np.ndarray) -> Tuple[float, float]:
+        """
+        Pearson r between x and popularity, with the same two-sided p-value as stats.pearsonr
+        
+        Popularity is centred once and reused; each product-sum is a single einsum pass
+        """
+        if self._pop_centered is None:
+            self._pop_centered = self._pop - np.float32(self._pop_mean)
+        yc = self._pop_centered
+        xc = x - np.asarray(x.mean(dtype=np.float64), dtype=x.dtype)
+        
+        def dot(a, b):
+            return np.einsum('i,i->', a, b, dtype=np.float64)
+        
+        r = dot(xc, yc) / np.sqrt(dot(xc, xc) * dot(yc, yc))
+        r = float(np.clip(r, -1.0, 1.0))
+        
+        from scipy import stats
+        
+        # Under H0, r is Beta(n/2 - 1, n/2 - 1) distributed on [-1, 1]
+        ab = len(x) / 2 - 1
+        p_value = 2 * stats.beta.sf(abs(r), ab, ab, loc=-1, scale=2)
+        return r, float(p_value)
+    
     def _test_word_count_groups(self) -> None:
         """Test if word count groups have different popularity distributions"""
-        # Create word count groups
-        self.data['word_count_group'] = pd.cut(
-            self.data['word_count'],
-            bins=[0, 1, 3, 5, float('inf')],
-            labels=['Single', 'Short', 'Medium', 'Long']
-        )
+        # Group codes from compare-and-add against the bin edges (1, 3, 5), without building
+        # a Categorical; rows outside every bin (no words or missing) get code -1 and are
+        # left out of the ANOVA
+        word_count = self.data['word_count'].to_numpy(dtype=np.float32, na_value=np.nan)
+        codes = (word_count > 1).astype(np.int8)
+        codes += word_count > 3
+        codes += word_count > 5
+        codes[~(word_count > 0)] = -1
+        
+        # Per-group count, sum and sum of squares in one pass
+        counts, sums, sumsqs = _grouped_moments(codes, self._pop, len(self._WORD_COUNT_LABELS))
+        observed = counts > 0
+        counts, sums, sumsqs = counts[observed], sums[observed], sumsqs[observed]
+        group_means = sums / counts
         
-        # Perform ANOVA
-        groups = [group for _, group in self.data.groupby('word_count_group')]
-        f_stat, p_value = stats.f_oneway(*[group['popularity'] for group in groups])
+        # One-way ANOVA F statistic in closed form from the group sums
+        from scipy import stats
+        n_groups, n_total = len(counts), counts.sum()
+        within_ss = np.sum(sumsqs - sums * group_means)
+        group_ss = np.sum(counts * (group_means - sums.sum() / n_total) ** 2)
+        f_stat = (group_ss / (n_groups - 1)) / (within_ss / (n_total - n_groups))
+        p_value = stats.f.sf(f_stat, n_groups - 1, n_total - n_groups)
         
         # Calculate effect size (eta squared)
-        total_ss = sum((self.data['popularity'] - self.data['popularity'].mean()) ** 2)
-        between_ss = sum(len(group) * ((group['popularity'].mean() - self.data['popularity'].mean()) ** 2)
-                        for group in groups)
+        total_ss = self._pop_var * len(self._pop)
+        between_ss = np.sum(counts * (group_means - self._pop_mean) ** 2)
         eta_squared = between_ss / total_ss
         
         result = TestResult(
@@ -86,16 +211,22 @@ class TitleFeatureAnalyzer:
     
     def _test_special_characters(self) -> None:
         """Test if presence of special characters affects popularity"""
-        # Perform t-test
-        with_special = self.data[self.data['has_special_chars']]['popularity']
-        without_special = self.data[~self.data['has_special_chars']]['popularity']
+        # Count, sum and sum of squares for each side in one pass
+        # (index 1 = with special characters, 0 = without); missing flags (-1) are left out
+        flags = self.data['has_special_chars'].to_numpy(dtype=np.int8, na_value=-1)
+        counts, sums, sumsqs = _grouped_moments(flags, self._pop, 2)
+        means = sums / counts
+        variances = (sumsqs - sums * means) / (counts - 1)
         
-        t_stat, p_value = stats.ttest_ind(with_special, without_special)
+        # Perform t-test (pooled variance, as stats.ttest_ind) from the moments already computed
+        from scipy import stats
+        stds = np.sqrt(variances)
+        t_stat, p_value = stats.ttest_ind_from_stats(
+            means[1], stds[1], counts[1], means[0], stds[0], counts[0], equal_var=True
+        )
         
         # Calculate Cohen's d
-        cohens_d = (with_special.mean() - without_special.mean()) / np.sqrt(
-            ((with_special.std() ** 2 + without_special.std() ** 2) / 2)
-        )
+        cohens_d = (means[1] - means[0]) / np.sqrt((variances[1] + variances[0]) / 2)
         
         result = TestResult(
             test_name="Special Characters t-test",
@@ -112,7 +243,7 @@ class TitleFeatureAnalyzer:
         if p_value > 0.05:
             return "No significant correlation found between title length and popularity"
         
-        strength = "strong" if abs(correlation) > 0.5 else "moderate" if abs(correlation) > 0.3 else "weak"
+        strength = self._CORRELATION_LABELS[int(np.searchsorted(self._CORRELATION_EDGES, abs(correlation)))]
         direction = "positive" if correlation > 0 else "negative"
         return f"Found {strength} {direction} correlation (r={correlation:.2f})"
     
@@ -121,7 +252,7 @@ class TitleFeatureAnalyzer:
         if p_value > 0.05:
             return "No significant difference found between word count groups"
         
-        effect = "large" if eta_squared > 0.14 else "medium" if eta_squared > 0.06 else "small"
+        effect = self._EFFECT_LABELS[int(np.searchsorted(self._ETA_SQUARED_EDGES, eta_squared))]
         return f"Found significant differences between groups with {effect} effect size (η²={eta_squared:.2f})"
     
     def _interpret_ttest(self, p_value: float, cohens_d: float) -> str:
@@ -129,7 +260,7 @@ class TitleFeatureAnalyzer:
         if p_value > 0.05:
             return "No significant difference found in popularity between titles with and without special characters"
         
-        effect = "large" if abs(cohens_d) > 0.8 else "medium" if abs(cohens_d) > 0.5 else "small"
+        effect = self._EFFECT_LABELS[int(np.searchsorted(self._COHENS_D_EDGES, abs(cohens_d)))]
         direction = "higher" if cohens_d > 0 else "lower"
         return f"Found {effect} effect size (d={cohens_d:.2f}) with {direction} popularity for titles with special characters"
     
@@ -0,0 +1,43 @@
+"""Checks that the Polars and pandas bias-correction paths keep the same rows, nulls included."""
+
+import contextlib
+import io
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+pytest.importorskip("polars")
+from src.data_processing import post_eda_cleaner
+
+def _frame_with_nulls(n: int = 2000) -> pd.DataFrame:
+    """Tracks with a few missing artists, genres and popularities."""
+    rng = np.random.default_rng(7)
+    artists = pd.Series(rng.choice([f'artist {i}' for i in range(20)], n), dtype='object')
+    artists[rng.random(n) < 0.05] = None
+    genres = pd.Series(rng.choice(['pop', 'rock', 'jazz'], n, p=[0.5, 0.3, 0.2]), dtype='object')
+    genres[rng.random(n) < 0.05] = None
+    popularity = pd.array(rng.integers(0, 101, n), dtype='Int8')
+    popularity[rng.random(n) < 0.02] = pd.NA
+    return pd.DataFrame({
+        'track_name': [f'track {i}' for i in range(n)],
+        'artist_name': artists,
+        'popularity': popularity,
+        'genre_category': genres,
+    })
+
+@pytest.mark.parametrize('strategy', ['artist_limit', 'stratified', 'remove_outliers'])
+def test_polars_and_pandas_paths_agree_on_nulls(monkeypatch, strategy):
+    df = _frame_with_nulls()
+    results = {}
+    for use_polars in (True, False):
+        monkeypatch.setattr(post_eda_cleaner, 'POLARS_AVAILABLE', use_polars)
+        cleaner = post_eda_cleaner.PostEDADataCleaner(df)
+        with contextlib.redirect_stdout(io.StringIO()):
+            results[use_polars] = cleaner.apply_bias_correction(strategy)
+
+    pd.testing.assert_frame_equal(results[True], results[False])
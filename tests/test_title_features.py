@@ -0,0 +1,45 @@
+"""Regression checks for the vectorised title features against the per-character definitions."""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+pytest.importorskip("spotipy")
+from src.data_collection.optimised_title_collector import OptimisedTitleCollector
+
+TITLES = [
+    'Hello World',
+    '東京\u3000ラブ',  # ideographic space
+    'Hello\u00a0World',  # no-break space
+    'Song ٣',
+    'Track ²',
+    'Track ½',  # a numeric fraction, but not a digit
+    'Part ①',
+    'Café del Mar',
+    'Déjà vu!',
+    'Rock & Roll',
+    '\uff34\uff4f\uff4b\uff59\uff4f\u3000\uff12\uff10\uff12\uff10',  # full-width
+    'tab\tseparated',
+    '',
+]
+
+def _reference_flags(title: str):
+    """The original per-character title features."""
+    return (
+        len(title),
+        len(title.split()),
+        any(c.isdigit() for c in title),
+        any(not c.isalnum() and not c.isspace() for c in title),
+    )
+
+def test_title_features_match_per_character_definition():
+    df = pd.DataFrame({'track_name': TITLES, 'duration_ms': 200000})
+    features = OptimisedTitleCollector._add_title_features(df)
+    
+    for row, title in zip(features.itertuples(index=False), TITLES):
+        assert (row.title_length, row.word_count, bool(row.has_numbers),
+                bool(row.has_special_chars)) == _reference_flags(title), title